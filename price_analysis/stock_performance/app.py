@@ -1,8 +1,12 @@
+import re
 import streamlit as st
 from datetime import datetime, timedelta
 from stock_performance import get_and_print_stock_performance
 from index_performance import get_and_display_index_performance
 
+# Commas with any surrounding whitespace in the symbols input
+_SYMBOL_SPLIT_RE = re.compile(r'\s*,\s*')
+
 # Streamlit app
 st.set_page_config(page_title='Stock and Index Performance Analysis', layout='wide')
 
@@ -32,7 +36,7 @@ with st.expander("Stock Performance Analysis"):
     normalize = st.checkbox('Normalize stock prices', value=True)
 
     if st.button('Analyze Stock Performance'):
-        symbols_list = [symbol.strip() for symbol in symbols.split(',')]
+        symbols_list = [symbol for symbol in _SYMBOL_SPLIT_RE.split(symbols.strip()) if symbol]
         start_date_str = start_date.strftime('%Y-%m-%d') if start_date else None
         end_date_str = end_date.strftime('%Y-%m-%d') if end_date else None
         get_and_print_stock_performance(symbols_list, period=period, start_date=start_date_str, end_date=end_date_str, normalize=normalize)
@@ -5,6 +5,18 @@ import yfinance as yf
 from datetime import datetime, timedelta
 import streamlit as st
 import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Parallel yfinance lookups in append_industry_info; each is a blocking
+# HTTP round trip, so threads overlap the network waits
+INDUSTRY_FETCH_WORKERS = 16
+
+# Industries rarely change, so successful lookups are kept on disk and
+# reused when an index file is rebuilt
+INDUSTRY_CACHE_FILE = 'industry_cache.json'
+INDUSTRY_CACHE_TTL = 30 * 24 * 60 * 60
 
 def fetch_components_slickcharts(index):
     base_url = "https://www.slickcharts.com/"
@@ -49,13 +61,48 @@ def fetch_industry_info(symbol):
         print(f"Error fetching data for {symbol}: {e}")
         return "N/A"
 
+def load_industry_cache(filename=INDUSTRY_CACHE_FILE):
+    try:
+        with open(filename, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_industry_cache(cache, filename=INDUSTRY_CACHE_FILE):
+    try:
+        with open(filename, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Error saving industry cache: {e}")
+
 def append_industry_info(df):
-    industries = []
-    for _, row in df.iterrows():
-        industry = fetch_industry_info(row['Symbol'])
-        industries.append(industry)
+    symbols = df['Symbol'].tolist()
+    cache = load_industry_cache()
+    now = time.time()
+    industries = {}
+    for symbol, entry in cache.items():
+        # Malformed entries (e.g. a hand-edited file) count as misses and
+        # are fetched again
+        try:
+            if now - entry['fetched_at'] < INDUSTRY_CACHE_TTL:
+                industries[symbol] = entry['industry']
+        except (KeyError, TypeError):
+            continue
+    
+    missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in industries]
+    if missing:
+        with ThreadPoolExecutor(max_workers=INDUSTRY_FETCH_WORKERS) as executor:
+            # map keeps results in symbol order
+            fetched = list(executor.map(fetch_industry_info, missing))
+        for symbol, industry in zip(missing, fetched):
+            industries[symbol] = industry
+            # Failed lookups are retried next time instead of cached
+            if industry != "N/A":
+                cache[symbol] = {'industry': industry, 'fetched_at': now}
+        save_industry_cache(cache)
     
-    df['Industry'] = industries
+    df['Industry'] = [industries[symbol] for symbol in symbols]
     return df
 
 def load_dataframe_from_file(filename):
@@ -76,28 +123,48 @@ def get_dataframe(index):
         save_dataframe_to_file(df, filename)
     return df
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def download_stock_data(symbols, start_date, end_date):
+    # Streamlit reruns the script on every widget change; cached downloads
+    # make repeat views of the same index and range skip Yahoo entirely
+    return yf.download(list(symbols), start=start_date, end=end_date, group_by='ticker', progress=False)
+
 def fetch_all_performance_data(df, start_date, end_date):
     symbols = df['Symbol'].tolist()
     try:
-        stock_data = yf.download(symbols, start=start_date, end=end_date, group_by='ticker', progress=False)
+        # Dates are floored to the hour so "now"-based ranges share a cache
+        # entry instead of producing a new key on every rerun
+        stock_data = download_stock_data(
+            tuple(symbols),
+            pd.Timestamp(start_date).floor('h'),
+            pd.Timestamp(end_date).floor('h')
+        )
     except Exception as e:
         st.write(f"Error fetching data: {e}")
         return []
     
+    if stock_data.empty:
+        return []
+    
+    try:
+        # Close prices of all symbols as one frame (columns are symbols), so
+        # the percent changes are computed in a single vectorized step
+        closes = stock_data.xs('Close', axis=1, level=1)
+        start_prices = closes.iloc[0]
+        percent_changes = (closes.iloc[-1] - start_prices) / start_prices * 100
+    except Exception as e:
+        # e.g. a flat column layout when yfinance's grouping changes
+        st.write(f"Error reading close prices: {e}")
+        return []
+    
     performance_data = []
-    for _, row in df.iterrows():
-        symbol = row['Symbol']
-        try:
-            hist = stock_data[symbol]
-            if hist.empty:
-                raise ValueError(f"No data for {symbol}")
-            start_price = hist['Close'].iloc[0]
-            end_price = hist['Close'].iloc[-1]
-            percent_change = (end_price - start_price) / start_price * 100
-            if not pd.isna(percent_change):
-                performance_data.append((symbol, row['Company'], percent_change, row['Industry']))
-        except Exception as e:
-            print(f"Error with {symbol}: {e}")
+    # Plain column iteration; iterrows builds a Series for every row
+    for symbol, company, industry in zip(symbols, df['Company'], df['Industry']):
+        percent_change = percent_changes.get(symbol)
+        if percent_change is None:
+            print(f"Error with {symbol}: No data for {symbol}")
+        elif not pd.isna(percent_change):
+            performance_data.append((symbol, company, percent_change, industry))
 
     performance_data.sort(key=lambda x: x[2], reverse=True)
     return performance_data
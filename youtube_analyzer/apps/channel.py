@@ -71,11 +71,18 @@ def list_channel_videos(channel_handle: str, days: Optional[int] = None, today:
         print(f"\nVideos from channel: {channel_handle}")
         print("=" * 50)
         
+        # One videos.list request per 50 videos instead of one per video
+        client.preload_video_clients(video_ids)
+        
+        # Build the listing once and write it in a single call
+        entries = []
         for vid_id in video_ids:
             video = client.create_or_get_video_client(vid_id)
-            print(f"{video.published_at.strftime('%Y-%m-%d')} | {video.title}")
-            print(f"https://youtube.com/watch?v={vid_id}")
-            print()  # Empty line between videos
+            entries.append(
+                f"{video.published_at.strftime('%Y-%m-%d')} | {video.title}\n"
+                f"https://youtube.com/watch?v={vid_id}\n"
+            )
+        sys.stdout.write("\n".join(entries) + "\n" if entries else "")
             
     except Exception as e:
         logger.error(f"Error listing videos: {e}")
@@ -73,6 +73,7 @@ def initialize_client(video_id: str,
     try:
         client = YouTubeVideoClient(
             video_id=video_id,
+            fetch_transcript=True,
         )
         
         # Add Claude processor if API key available
@@ -21,7 +21,7 @@ if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
 # Absolute imports
-from libs.utils import DateFilter
+from libs.utils import CacheConfig, DateFilter
 from libs.youtube_api_client import YouTubeAPIClient
 from libs.channel_client import ChannelClientFactory
 from libs.video_client import YouTubeVideoClient
@@ -49,6 +49,15 @@ AVAILABLE_MODELS = {
     }
 }
 
+# On-disk cache for video metadata, transcripts and LLM analyses, so a
+# restarted app doesn't re-run analyses it has already done
+CACHE_CONFIG = CacheConfig(
+    cache_dir=os.getenv(
+        "YOUTUBE_ANALYZER_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "youtube_analyzer")
+    )
+)
+
 # Some preset channels
 PRESET_CHANNELS = {
     "Lex Fridman": "@lexfridman",
@@ -62,16 +71,23 @@ PRESET_CHANNELS = {
 # ------------------------------------------------------------------------------
 # Initialization Helpers
 # ------------------------------------------------------------------------------
+@st.cache_resource
+def get_api_client() -> YouTubeAPIClient:
+    """Share one YouTube API client across reruns and sessions."""
+    return YouTubeAPIClient(api_key=os.getenv("YOUTUBE_API_KEY"))
+
+
 def initialize_channel_client(channel_name: str):
     """Initialize channel client just like old st_channel_app."""
-    api_client = YouTubeAPIClient(api_key=os.getenv("YOUTUBE_API_KEY"))
-    channel_id = api_client.get_channel_id(channel_name)
+    # YouTubeAPIClient caches handle lookups, so reruns don't re-resolve
+    channel_id = get_api_client().get_channel_id(channel_name)
     
     channel_client = ChannelClientFactory.create_channel(
         channel_type="youtube",
         channel_id=channel_id,
         youtube_api_key=os.getenv("YOUTUBE_API_KEY"),
-        timezone='America/Chicago'
+        timezone='America/Chicago',
+        cache_config=CACHE_CONFIG
     )
 
     # Optionally add channel-level LLM processors
@@ -100,11 +116,14 @@ def initialize_channel_client(channel_name: str):
 
 def initialize_video_client(video_id_or_url: str) -> YouTubeVideoClient:
     """Initialize a YouTubeVideoClient exactly like old st_video_app."""
-    api_client = YouTubeAPIClient(api_key=os.getenv("YOUTUBE_API_KEY"))
+    api_client = get_api_client()
     video_id = api_client.parse_video_id(video_id_or_url)
 
     client = YouTubeVideoClient(
         video_id=video_id,
+        youtube_api_client=api_client,
+        cache_config=CACHE_CONFIG,
+        fetch_transcript=True,
     )
 
     # Add LLM processors
@@ -165,7 +184,11 @@ def render_channel_tab():
             )
             
             logger.info(f"Found {len(video_ids)} videos")
+            if client.partial_update:
+                st.warning("YouTube API quota is running low; showing only the videos fetched so far.")
             
+            # One videos.list request per 50 videos instead of one per video
+            client.preload_video_clients(video_ids)
             videos = [client.create_or_get_video_client(v_id) for v_id in video_ids]
             for vid in videos:
                 logger.info(f"Video {vid.video_id} published at: {vid.published_at}")
@@ -275,11 +298,31 @@ def render_video_tab():
                 if (st.session_state.get("selected_video_url") != st.session_state.get("last_analyzed_url")):
                     with st.spinner("Analyzing video..."):
                         try:
-                            results = vclient.analyze_video(
-                                processor_names=st.session_state.selected_models,
-                                task=st.session_state.selected_task,
-                                role=st.session_state.selected_role
-                            )
+                            selected_models = st.session_state.selected_models
+                            if len(selected_models) == 1:
+                                # Single model: stream the analysis as it is written
+                                placeholder = st.empty()
+                                stream = vclient.stream_analysis(
+                                    processor_name=selected_models[0],
+                                    task=st.session_state.selected_task,
+                                    role=st.session_state.selected_role
+                                )
+                                try:
+                                    while True:
+                                        placeholder.markdown(next(stream), unsafe_allow_html=True)
+                                except StopIteration as done:
+                                    # The generator returns the complete result
+                                    results = [done.value] if done.value else []
+                                except Exception:
+                                    # Don't leave a cut-off analysis on screen
+                                    placeholder.empty()
+                                    raise
+                            else:
+                                results = vclient.analyze_video(
+                                    processor_names=selected_models,
+                                    task=st.session_state.selected_task,
+                                    role=st.session_state.selected_role
+                                )
                             st.session_state.current_results = results
                             st.session_state.last_analyzed_url = st.session_state.selected_video_url
                             st.rerun()
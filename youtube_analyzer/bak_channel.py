@@ -137,12 +137,11 @@ class Channel(ABC):
         """
 
         videos_to_show = self.videos[:num_videos] if num_videos is not None else self.videos
-        video_list = "<h3>Videos:</h3><ol>"
-        for video in videos_to_show:
-            video_url = f"https://www.youtube.com/watch?v={video.video_id}"
-            video_link = make_clickable(video.title, video_url)
-            video_list += f"<li>{video_link}</li>"
-        video_list += "</ol>"
+        video_items = [
+            f"<li>{make_clickable(video.title, f'https://www.youtube.com/watch?v={video.video_id}')}</li>"
+            for video in videos_to_show
+        ]
+        video_list = "<h3>Videos:</h3><ol>" + "".join(video_items) + "</ol>"
 
         full_info = channel_info + video_list
 
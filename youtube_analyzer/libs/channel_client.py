@@ -1,9 +1,12 @@
 from typing import Dict, List, Optional
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 import pytz
 import logging
-from .utils import DateFilter
+from .utils import CacheConfig, DateFilter
 from .llm_processor import LLMConfig, Task
+from .video import Video
 from .video_client import YouTubeVideoClient
 from .youtube_api_client import YouTubeAPIClient
 
@@ -15,10 +18,17 @@ class BaseChannelClient:
     This is the base class for both YouTube channels and virtual collections.
     """
     
-    def __init__(self, name: str, youtube_api_key: str = None, timezone: str = 'America/Chicago'):
+    # Videos analyzed concurrently in analyze_videos
+    DEFAULT_MAX_PARALLEL_VIDEOS = 4
+    
+    def __init__(self, name: str, youtube_api_key: str = None, timezone: str = 'America/Chicago',
+                 cache_config: Optional[CacheConfig] = None):
         self.name = name
         self.timezone = pytz.timezone(timezone)
         self.youtube_api_key = youtube_api_key  # Store the API key
+        # Optional on-disk cache shared by all videos, so metadata, transcripts
+        # and LLM analyses survive restarts
+        self.cache_config = cache_config
         
         # Core state
         self.channel_metadata: Dict = {}
@@ -33,6 +43,8 @@ class BaseChannelClient:
         
         # Last update tracking
         self.last_update: Optional[datetime] = None
+        # True when the last update stopped early because quota ran low
+        self.partial_update: bool = False
         
         # Initialize YouTube API client with optional key
         self.youtube_api_client = YouTubeAPIClient(api_key=youtube_api_key)
@@ -52,7 +64,9 @@ class BaseChannelClient:
             query: Optional search query string to filter videos
             
         Returns:
-            List[str]: List of video IDs in reverse chronological order (newest first)
+            List[str]: List of video IDs in reverse chronological order (newest first).
+                If quota runs low, the pages fetched so far are returned and
+                partial_update is set.
             
         Examples:
             # Get all videos
@@ -76,9 +90,21 @@ class BaseChannelClient:
             search_params['q'] = query
 
         new_video_ids = []
+        known_video_ids = set(self.video_ids)
         page_token = None
+        search_cost = self.youtube_api_client.QUOTA_COSTS['youtube.search.list']
+        self.partial_update = False
         
         while True:
+            # Stop before a page the remaining quota can't pay for, rather
+            # than failing mid-pagination with a quota error
+            if self.youtube_api_client.quota_remaining() < search_cost:
+                logger.warning(
+                    f"YouTube API quota low; stopping after {len(new_video_ids)} new videos"
+                )
+                self.partial_update = True
+                break
+            
             try:
                 request = self.youtube_api_client.create_search_request(
                     part="id",
@@ -94,7 +120,8 @@ class BaseChannelClient:
                 
                 for item in response.get('items', []):
                     video_id = item['id']['videoId']
-                    if video_id not in self.video_ids:
+                    if video_id not in known_video_ids:
+                        known_video_ids.add(video_id)
                         new_video_ids.append(video_id)
                         self.video_ids.append(video_id)
                     
@@ -114,7 +141,9 @@ class BaseChannelClient:
         if video_id not in self._video_clients:
             client = YouTubeVideoClient(
                 video_id=video_id,
-                youtube_api_key=self.youtube_api_key  # Pass the stored API key
+                youtube_api_key=self.youtube_api_key,  # Pass the stored API key
+                youtube_api_client=self.youtube_api_client,
+                cache_config=self.cache_config
             )
             
             # Add any channel-level processors
@@ -125,31 +154,178 @@ class BaseChannelClient:
             
         return self._video_clients[video_id]
 
+    def preload_video_clients(self, video_ids: List[str]) -> None:
+        """Create video clients for many videos using batched metadata requests
+        
+        Fetches metadata for all uncached video IDs with Video.create_from_video_ids
+        (one API request per 50 videos) instead of one request per video.
+        Videos recently fetched by any video client are reused without a
+        request. Failures are logged; create_or_get_video_client still falls
+        back to fetching videos individually.
+        """
+        videos = []
+        new_ids = []
+        for video_id in dict.fromkeys(video_ids):
+            if video_id in self._video_clients:
+                continue
+            cached = YouTubeVideoClient._get_cached_video(
+                video_id, timezone=self.timezone.zone, cache_config=self.cache_config
+            )
+            if cached is not None:
+                videos.append(cached)
+            else:
+                new_ids.append(video_id)
+
+        if new_ids:
+            try:
+                videos.extend(Video.create_from_video_ids(
+                    new_ids,
+                    youtube_api_client=self.youtube_api_client,
+                    timezone=self.timezone.zone,
+                    cache_config=self.cache_config
+                ))
+            except Exception as e:
+                logger.error(f"Error preloading video metadata: {e}")
+
+        for video in videos:
+            client = YouTubeVideoClient(
+                video_id=video.video_id,
+                youtube_api_key=self.youtube_api_key,
+                youtube_api_client=self.youtube_api_client,
+                cache_config=self.cache_config,
+                video=video
+            )
+            for name, config in self._processors.items():
+                client.add_processor(name, config)
+            self._video_clients[video.video_id] = client
+
     def analyze_videos(self, 
                       video_ids: Optional[List[str]] = None,
                       processor_names: Optional[List[str]] = None,
-                      task: Optional[Task] = None) -> Dict[str, List]:
-        """Analyze multiple videos"""
+                      task: Optional[Task] = None,
+                      transcript_workers: int = Video.DEFAULT_TRANSCRIPT_WORKERS,
+                      max_parallel_videos: int = DEFAULT_MAX_PARALLEL_VIDEOS) -> Dict[str, List]:
+        """Analyze multiple videos
+        
+        Transcript fetching and analysis are pipelined: each video's analysis
+        starts as soon as its transcript is ready, while the remaining
+        transcripts are still downloading.
+        
+        Args:
+            video_ids: Videos to analyze (defaults to the channel's videos)
+            processor_names: Processors to run (defaults to all)
+            task: Analysis task (defaults to summarize)
+            transcript_workers: Concurrent transcript fetches; lower this if
+                YouTube starts rejecting requests
+            max_parallel_videos: Videos analyzed concurrently
+            
+        Returns:
+            Dict mapping video IDs (in input order) to their analysis results
+        """
         if video_ids is None:
             video_ids = self.video_ids
             
         if not task:
             task = Task.summarize()
+        if not processor_names:
+            processor_names = list(self._processors)
             
+        self.preload_video_clients(video_ids)
+
         results = {}
+        clients = {}
         for video_id in video_ids:
             try:
-                client = self.create_or_get_video_client(video_id)
-                analysis = client.analyze_video(
+                clients[video_id] = self.create_or_get_video_client(video_id)
+            except Exception as e:
+                logger.error(f"Error analyzing video {video_id}: {e}")
+                results[video_id] = []
+
+        def analyze(video_id: str) -> List:
+            try:
+                return clients[video_id].analyze_video(
                     processor_names=processor_names,
                     task=task
                 )
-                results[video_id] = analysis
             except Exception as e:
                 logger.error(f"Error analyzing video {video_id}: {e}")
-                results[video_id] = []
-                
-        return results
+                return []
+
+        analyses: Dict[str, Future] = {}
+        if clients:
+            with ThreadPoolExecutor(max_workers=max(1, min(transcript_workers, len(clients)))) as fetch_pool, \
+                 ThreadPoolExecutor(max_workers=max(1, min(max_parallel_videos, len(clients)))) as analysis_pool:
+                fetches = {
+                    fetch_pool.submit(client.video.get_transcript): video_id
+                    for video_id, client in clients.items()
+                }
+                for fetch in as_completed(fetches):
+                    video_id = fetches[fetch]
+                    analyses[video_id] = analysis_pool.submit(analyze, video_id)
+
+        return {
+            video_id: analyses[video_id].result() if video_id in analyses else results[video_id]
+            for video_id in video_ids
+        }
+
+    async def aanalyze_videos(self,
+                              video_ids: Optional[List[str]] = None,
+                              processor_names: Optional[List[str]] = None,
+                              task: Optional[Task] = None,
+                              max_parallel_videos: int = DEFAULT_MAX_PARALLEL_VIDEOS) -> Dict[str, List]:
+        """Analyze multiple videos on an event loop
+        
+        Async counterpart of analyze_videos. A fixed pool of workers takes
+        videos from a queue, so at most max_parallel_videos are in flight,
+        and each video queries its processors through their async clients.
+        Model requests across all videos are additionally capped per
+        provider (LLMProcessor.MAX_CONCURRENT_REQUESTS), so several videos
+        with several processors don't exceed provider rate limits.
+        
+        Args:
+            video_ids: Videos to analyze (defaults to the channel's videos)
+            processor_names: Processors to run (defaults to all)
+            task: Analysis task (defaults to summarize)
+            max_parallel_videos: Videos analyzed concurrently
+            
+        Returns:
+            Dict mapping video IDs (in input order) to their analysis results
+        """
+        if video_ids is None:
+            video_ids = self.video_ids
+            
+        if not task:
+            task = Task.summarize()
+        if not processor_names:
+            processor_names = list(self._processors)
+            
+        await asyncio.to_thread(self.preload_video_clients, video_ids)
+
+        results: Dict[str, List] = {}
+        queue: asyncio.Queue = asyncio.Queue()
+        for video_id in dict.fromkeys(video_ids):
+            queue.put_nowait(video_id)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    video_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    client = await asyncio.to_thread(self.create_or_get_video_client, video_id)
+                    results[video_id] = await client.aanalyze_video(
+                        processor_names=processor_names,
+                        task=task
+                    )
+                except Exception as e:
+                    logger.error(f"Error analyzing video {video_id}: {e}")
+                    results[video_id] = []
+
+        workers = max(1, min(max_parallel_videos, queue.qsize()))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        return {video_id: results[video_id] for video_id in video_ids}
 
     def add_processor(self, name: str, config: LLMConfig) -> None:
         """Add processor configuration"""
@@ -188,8 +364,10 @@ class BaseChannelClient:
 class YouTubeChannelClient(BaseChannelClient):
     """Client for managing YouTube channel analysis"""
     
-    def __init__(self, channel_id: str, youtube_api_key: str = None, timezone: str = 'America/Chicago'):
-        super().__init__(name=channel_id, youtube_api_key=youtube_api_key, timezone=timezone)
+    def __init__(self, channel_id: str, youtube_api_key: str = None, timezone: str = 'America/Chicago',
+                 cache_config: Optional[CacheConfig] = None):
+        super().__init__(name=channel_id, youtube_api_key=youtube_api_key, timezone=timezone,
+                         cache_config=cache_config)
         self.channel_id = channel_id
         self._fetch_channel_metadata()
 
@@ -238,7 +416,9 @@ class YouTubeChannelClient(BaseChannelClient):
         if video_id not in self._video_clients:
             client = YouTubeVideoClient(
                 video_id=video_id,
-                youtube_api_key=self.youtube_api_key
+                youtube_api_key=self.youtube_api_key,
+                youtube_api_client=self.youtube_api_client,
+                cache_config=self.cache_config
             )
             
             # Add any channel-level processors
@@ -253,8 +433,9 @@ class YouTubeChannelClient(BaseChannelClient):
 class VirtualChannelClient(BaseChannelClient):
     """Client for custom video collections"""
     
-    def __init__(self, name: str, video_ids: List[str], youtube_api_key: str, timezone: str = 'America/Chicago'):
-        super().__init__(name=name, timezone=timezone)
+    def __init__(self, name: str, video_ids: List[str], youtube_api_key: str, timezone: str = 'America/Chicago',
+                 cache_config: Optional[CacheConfig] = None):
+        super().__init__(name=name, timezone=timezone, cache_config=cache_config)
         self.youtube_api_key = youtube_api_key
         self.video_ids = video_ids.copy()
 
@@ -263,7 +444,9 @@ class VirtualChannelClient(BaseChannelClient):
         if video_id not in self._video_clients:
             client = YouTubeVideoClient(
                 video_id=video_id,
-                youtube_api_key=self.youtube_api_key
+                youtube_api_key=self.youtube_api_key,
+                youtube_api_client=self.youtube_api_client,
+                cache_config=self.cache_config
             )
             
             # Add any channel-level processors
@@ -292,13 +475,15 @@ class ChannelClientFactory:
         if channel_type == "youtube":
             return YouTubeChannelClient(
                 channel_id=kwargs['channel_id'],
-                timezone=kwargs.get('timezone', 'America/Chicago')
+                timezone=kwargs.get('timezone', 'America/Chicago'),
+                cache_config=kwargs.get('cache_config')
             )
         elif channel_type == "virtual":
             return VirtualChannelClient(
                 name=kwargs['name'],
                 video_ids=kwargs['video_ids'],
-                timezone=kwargs.get('timezone', 'America/Chicago')
+                timezone=kwargs.get('timezone', 'America/Chicago'),
+                cache_config=kwargs.get('cache_config')
             )
         else:
             raise ValueError(f"Unsupported channel type: {channel_type}") 
\ No newline at end of file
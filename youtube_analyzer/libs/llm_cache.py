@@ -0,0 +1,49 @@
+import logging
+import os
+from typing import Optional
+
+from .utils import CacheConfig, load_json_cache, save_json_atomic
+
+logger = logging.getLogger(__name__)
+
+class LLMResponseCache:
+    """Persistent cache of LLM responses keyed by a prompt hash
+    
+    Each response is stored as its own JSON file, so concurrent writers
+    never contend on a shared file and writes stay atomic.
+    
+    Example:
+        >>> cache = LLMResponseCache(CacheConfig(cache_dir="cache"))
+        >>> cache.set(key, "summary text")
+        >>> cache.get(key)
+        'summary text'
+    """
+    
+    SUBDIR = "llm"
+    
+    def __init__(self, cache_config: CacheConfig):
+        """Initialize cache
+        
+        Args:
+            cache_config: Cache directory and TTL for stored responses
+        """
+        self.cache_config = cache_config
+        self.cache_dir = os.path.join(cache_config.cache_dir, self.SUBDIR)
+    
+    def _path(self, key: str) -> str:
+        """Get the file path for a cache key"""
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None if missing or expired"""
+        data = load_json_cache(self._path(key), self.cache_config.ttl_seconds)
+        if not isinstance(data, dict):
+            return None
+        return data.get('response')
+    
+    def set(self, key: str, response: str) -> None:
+        """Store a response; failures are logged and otherwise ignored"""
+        try:
+            save_json_atomic(self._path(key), {'response': response})
+        except OSError as e:
+            logger.warning("Failed to write LLM cache entry %s: %s", key, e)
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterator
 from pydantic import BaseModel
 from langchain_anthropic import ChatAnthropic
 from langchain_openai import ChatOpenAI
@@ -9,9 +9,59 @@ from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.chains import LLMChain
 from langchain.schema.runnable import RunnablePassthrough, RunnableLambda
 from operator import itemgetter
+from .llm_cache import LLMResponseCache
+from .utils import CacheConfig, Singleflight
+from collections import OrderedDict
+from functools import lru_cache
+import httpx
+import asyncio
+import hashlib
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by all OpenAI processors; sized above the per-provider
+# concurrency limit so parallel analyses never queue for a connection
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+
+@lru_cache(maxsize=None)
+def _shared_http_client() -> httpx.Client:
+    """Get the process-wide pooled HTTP client for LLM API calls"""
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+        )
+    )
+
+@lru_cache(maxsize=32)
+def _chat_model(provider: str, model_name: str, temperature: float, max_tokens: int, api_key: str):
+    """Get the LangChain chat model for a configuration
+    
+    Chat models hold no per-conversation state, so processors with the same
+    configuration (e.g. one per video in a channel) share a model and with
+    it the provider SDK client and its connection pool.
+    """
+    if provider == "anthropic":
+        return ChatAnthropic(
+            model=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            anthropic_api_key=api_key
+        )
+    elif provider == "openai":
+        return ChatOpenAI(
+            model=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            openai_api_key=api_key,
+            http_client=_shared_http_client()
+        )
+    raise ValueError(f"Unsupported provider: {provider}")
+
 class LLMConfig(BaseModel):
     """Configuration for Language Models"""
     model_config = {
@@ -182,30 +232,59 @@ class Task(BaseModel):
 class LLMProcessor:
     """Processes text using language models with configurable roles and tasks"""
     
-    def __init__(self, config: LLMConfig):
-        """Initialize processor with config"""
+    # Responses shared by all processors, keyed on model settings and prompts
+    RESPONSE_CACHE_SIZE = 512
+    _response_cache: 'OrderedDict[str, str]' = OrderedDict()
+    _response_cache_lock = threading.Lock()
+    # Identical prompts issued concurrently share one model call
+    _inflight = Singleflight()
+    
+    # Upper bound on in-flight requests per provider across all processors,
+    # so parallel analyses don't trip provider rate limits. Threaded and
+    # async calls (per event loop) are each held to this limit.
+    MAX_CONCURRENT_REQUESTS = 5
+    _provider_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+    _provider_semaphores_lock = threading.Lock()
+    # Async counterparts (per-provider semaphores and in-flight requests).
+    # asyncio primitives belong to one event loop, so they are kept per loop.
+    _async_loop_states: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Dict]]' = weakref.WeakKeyDictionary()
+    
+    # Texts longer than this (~100k tokens) are summarized in chunks and then
+    # reduced, instead of failing with a context length error
+    MAX_INPUT_CHARS = 400_000
+    CHUNK_CHARS = 200_000
+    CHUNK_OVERLAP_CHARS = 1_000
+    
+    REDUCE_PROMPT_TEMPLATE = """The following is an ordered list of answers, each produced from one consecutive portion of a longer piece of content, for the task below.
+Generate a final answer for the whole content by aggregating these answers. Remove duplicated points and keep the format requested by the task.
+
+Task:
+{instructions}
+
+Answers:
+{{text}}"""
+    
+    def __init__(self, config: LLMConfig, cache_config: Optional[CacheConfig] = None):
+        """Initialize processor with config
+        
+        Args:
+            config: Model configuration
+            cache_config: Optional on-disk cache so responses survive restarts
+        """
         self.config = config
+        self._disk_cache = LLMResponseCache(cache_config) if cache_config else None
         self._init_client()
     
     def _init_client(self):
         """Initialize LangChain client based on provider"""
         try:
-            if self.config.provider == "anthropic":
-                self.client = ChatAnthropic(
-                    model=self.config.model_name,
-                    temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens,
-                    anthropic_api_key=self.config.api_key
-                )
-            elif self.config.provider == "openai":
-                self.client = ChatOpenAI(
-                    model=self.config.model_name,
-                    temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens,
-                    openai_api_key=self.config.api_key
-                )
-            else:
-                raise ValueError(f"Unsupported provider: {self.config.provider}")
+            self.client = _chat_model(
+                self.config.provider,
+                self.config.model_name,
+                self.config.temperature,
+                self.config.max_tokens,
+                self.config.api_key
+            )
         except Exception as e:
             logger.error(f"Error initializing client: {str(e)}")
             raise
@@ -221,30 +300,335 @@ class LLMProcessor:
         Returns:
             Processed text or None if processing fails
         """
+        if len(text) > self.MAX_INPUT_CHARS:
+            return self._process_in_chunks(text, task, role)
+        
         try:
-            messages = []
+            messages = self._build_messages(text, task, role)
+            
+            cache_key = self._cache_key(messages)
+            cached = self._lookup_response(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached response for task: {task.name}")
+                return cached
+            
+            def invoke() -> str:
+                with self._provider_semaphore(self.config.provider):
+                    response = self.client.invoke(messages)
+                self._store_response(cache_key, response.content)
+                return response.content
+            
+            return self._inflight.do(cache_key, invoke)
+                
+        except Exception as e:
+            logger.error(f"Error processing text: {str(e)}")
+            return None
+
+    def stream_text(self, text: str, task: Task, role: Optional[Role] = None) -> Iterator[str]:
+        """Process text, yielding the response in pieces as the model produces it
+        
+        Cached responses, and long texts that need chunked processing, are
+        yielded in one piece. The complete response is cached like
+        process_text's.
+        
+        Args:
+            text: Input text to process
+            task: Task to perform
+            role: Optional role to use (defaults to None)
             
-            # Add system message if role is provided
-            if role and role.system_prompt:
-                messages.append(SystemMessage(content=role.system_prompt))
+        Yields:
+            Consecutive pieces of the response
             
-            # Format task prompt with input text
-            formatted_prompt = task.prompt_template.format(text=text)
-            messages.append(HumanMessage(content=formatted_prompt))
+        Raises:
+            Exception: If the request or the stream fails, so a cut-off
+                response is never mistaken for a complete one
+        """
+        if len(text) > self.MAX_INPUT_CHARS:
+            response = self._process_in_chunks(text, task, role)
+            if response:
+                yield response
+            return
+        
+        try:
+            messages = self._build_messages(text, task, role)
             
-            # Log the prompts being used
-            logger.info(f"Role: {role.name if role else 'None'}")
-            logger.info(f"Task: {task.name}")
-            logger.info(f"System prompt: {role.system_prompt if role and role.system_prompt else 'None'}")
-            logger.info(f"Task prompt: {formatted_prompt}")
+            cache_key = self._cache_key(messages)
+            cached = self._lookup_response(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached response for task: {task.name}")
+                yield cached
+                return
             
-            response = self.client.invoke(messages)
-            return response.content
+            parts = []
+            with self._provider_semaphore(self.config.provider):
+                for chunk in self.client.stream(messages):
+                    if isinstance(chunk.content, str) and chunk.content:
+                        parts.append(chunk.content)
+                        yield chunk.content
+            self._store_response(cache_key, ''.join(parts))
+                
+        except Exception as e:
+            logger.error(f"Error streaming text: {str(e)}")
+            raise
+
+    async def aprocess_text(self, text: str, task: Task, role: Optional[Role] = None) -> Optional[str]:
+        """Process text without blocking the event loop
+        
+        Same as process_text, but awaits the provider's native async client.
+        Requests are limited to MAX_CONCURRENT_REQUESTS per provider on each
+        event loop, and identical prompts in flight share one call.
+        
+        Args:
+            text: Input text to process
+            task: Task to perform
+            role: Optional role to use (defaults to None)
+            
+        Returns:
+            Processed text or None if processing fails
+        """
+        if len(text) > self.MAX_INPUT_CHARS:
+            return await self._aprocess_in_chunks(text, task, role)
+        
+        try:
+            messages = self._build_messages(text, task, role)
+            
+            cache_key = self._cache_key(messages)
+            cached = self._lookup_response(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached response for task: {task.name}")
+                return cached
+            
+            # Identical prompts awaited concurrently share one model call
+            state = self._async_loop_state()
+            request = state['inflight'].get(cache_key)
+            if request is None:
+                request = asyncio.ensure_future(self._ainvoke(messages, cache_key, state))
+                state['inflight'][cache_key] = request
+                request.add_done_callback(lambda _: state['inflight'].pop(cache_key, None))
+            # Shielded so one cancelled caller doesn't cancel the shared call
+            return await asyncio.shield(request)
                 
         except Exception as e:
             logger.error(f"Error processing text: {str(e)}")
             return None
 
+    async def _ainvoke(self, messages: List, cache_key: str, state: Dict[str, Dict]) -> str:
+        """Call the model within the provider's async request limit and cache the response"""
+        semaphore = state['semaphores'].get(self.config.provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+            state['semaphores'][self.config.provider] = semaphore
+        async with semaphore:
+            response = await self.client.ainvoke(messages)
+        self._store_response(cache_key, response.content)
+        return response.content
+
+    def process_texts(self,
+                      texts: List[str],
+                      task: Task,
+                      role: Optional[Role] = None,
+                      max_concurrency: Optional[int] = None) -> List[Optional[str]]:
+        """Process many texts with the same task in parallel
+        
+        Each text goes through process_text, so cached responses are reused and
+        the per-provider request limit still applies.
+        
+        Args:
+            texts: Input texts to process
+            task: Task to perform on each text
+            role: Optional role to use (defaults to None)
+            max_concurrency: Maximum parallel requests (defaults to MAX_CONCURRENT_REQUESTS)
+            
+        Returns:
+            Processed texts in input order, None for texts that failed
+        """
+        if not texts:
+            return []
+        max_workers = min(len(texts), max_concurrency or self.MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda text: self.process_text(text, task, role), texts))
+
+    async def aprocess_texts(self,
+                             texts: List[str],
+                             task: Task,
+                             role: Optional[Role] = None,
+                             max_concurrency: Optional[int] = None) -> List[Optional[str]]:
+        """Process many texts concurrently on one event loop
+        
+        Args:
+            texts: Input texts to process
+            task: Task to perform on each text
+            role: Optional role to use (defaults to None)
+            max_concurrency: Maximum in-flight requests (defaults to MAX_CONCURRENT_REQUESTS)
+            
+        Returns:
+            Processed texts in input order, None for texts that failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENT_REQUESTS)
+
+        async def process(text: str) -> Optional[str]:
+            async with semaphore:
+                return await self.aprocess_text(text, task, role)
+
+        return await asyncio.gather(*(process(text) for text in texts))
+
+    def _process_in_chunks(self, text: str, task: Task, role: Optional[Role] = None) -> Optional[str]:
+        """Run a task over overlapping chunks of a long text, then reduce the answers
+        
+        Chunks are processed in parallel; the per-provider semaphore still
+        bounds how many requests are in flight.
+        """
+        chunks = self._split_text(text)
+        logger.info(f"Text too long ({len(text)} chars), processing {len(chunks)} chunks for task: {task.name}")
+        
+        with ThreadPoolExecutor(max_workers=min(len(chunks), self.MAX_CONCURRENT_REQUESTS)) as executor:
+            answers = list(executor.map(lambda chunk: self.process_text(chunk, task, role), chunks))
+        
+        answers = [answer for answer in answers if answer]
+        if len(answers) <= 1:
+            return answers[0] if answers else None
+        return self.process_text(self._combine_answers(answers), self._reduce_task(task), role)
+
+    async def _aprocess_in_chunks(self, text: str, task: Task, role: Optional[Role] = None) -> Optional[str]:
+        """Async counterpart of _process_in_chunks, running the chunks on the event loop"""
+        chunks = self._split_text(text)
+        logger.info(f"Text too long ({len(text)} chars), processing {len(chunks)} chunks for task: {task.name}")
+        
+        answers = await self.aprocess_texts(chunks, task, role)
+        
+        answers = [answer for answer in answers if answer]
+        if len(answers) <= 1:
+            return answers[0] if answers else None
+        return await self.aprocess_text(self._combine_answers(answers), self._reduce_task(task), role)
+
+    def _reduce_task(self, task: Task) -> Task:
+        """Build the task that merges per-chunk answers of task"""
+        instructions = task.prompt_template.format(text="(provided as the answers below)")
+        return Task(
+            name=f"{task.name}_reduce",
+            description=f"Combine chunked answers for: {task.description}",
+            prompt_template=self.REDUCE_PROMPT_TEMPLATE.format(
+                instructions=instructions.replace('{', '{{').replace('}', '}}')
+            )
+        )
+
+    @staticmethod
+    def _combine_answers(answers: List[str]) -> str:
+        """Number per-chunk answers in order for the reduce prompt"""
+        return "\n\n".join(f"Part {i}:\n{answer}" for i, answer in enumerate(answers, 1))
+
+    def _split_text(self, text: str) -> List[str]:
+        """Split text into overlapping chunks, breaking at whitespace where possible"""
+        chunks = []
+        start = 0
+        while start < len(text):
+            end = min(start + self.CHUNK_CHARS, len(text))
+            if end < len(text):
+                space = text.rfind(' ', start + self.CHUNK_CHARS // 2, end)
+                if space != -1:
+                    end = space
+            chunks.append(text[start:end])
+            if end >= len(text):
+                break
+            start = max(end - self.CHUNK_OVERLAP_CHARS, start + 1)
+        return chunks
+
+    def _build_messages(self, text: str, task: Task, role: Optional[Role] = None) -> List:
+        """Build the chat messages for a task and optional role"""
+        messages = []
+        
+        # Add system message if role is provided
+        if role and role.system_prompt:
+            messages.append(SystemMessage(content=role.system_prompt))
+        
+        # Format task prompt with input text
+        formatted_prompt = task.prompt_template.format(text=text)
+        messages.append(HumanMessage(content=formatted_prompt))
+        
+        # Log the prompts being used; the full prompt embeds the whole
+        # transcript, so it is only formatted when debug logging is on
+        logger.info("Role: %s", role.name if role else 'None')
+        logger.info("Task: %s", task.name)
+        logger.debug("System prompt: %s", role.system_prompt if role and role.system_prompt else 'None')
+        logger.debug("Task prompt: %s", formatted_prompt)
+        
+        return messages
+
+    @classmethod
+    def _provider_semaphore(cls, provider: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to a provider"""
+        with cls._provider_semaphores_lock:
+            semaphore = cls._provider_semaphores.get(provider)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(cls.MAX_CONCURRENT_REQUESTS)
+                cls._provider_semaphores[provider] = semaphore
+            return semaphore
+
+    @classmethod
+    def _async_loop_state(cls) -> Dict[str, Dict]:
+        """Get the running event loop's provider semaphores and in-flight requests"""
+        loop = asyncio.get_running_loop()
+        with cls._provider_semaphores_lock:
+            state = cls._async_loop_states.get(loop)
+            if state is None:
+                state = {'semaphores': {}, 'inflight': {}}
+                cls._async_loop_states[loop] = state
+            return state
+
+    def _cache_key(self, messages: List) -> str:
+        """Build a response cache key from the model settings and prompt messages
+        
+        Message text is whitespace-normalized so transcripts that differ only in
+        line breaks or spacing (e.g. re-uploads, re-fetched captions) share
+        cached responses.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.config.provider, self.config.model_name,
+                     str(self.config.temperature), str(self.config.max_tokens)):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        for message in messages:
+            digest.update(message.type.encode('utf-8'))
+            digest.update(b'\0')
+            digest.update(' '.join(message.content.split()).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _lookup_response(self, key: str) -> Optional[str]:
+        """Look up a response in memory, then in the disk cache if configured"""
+        response = self._get_cached_response(key)
+        if response is None and self._disk_cache is not None:
+            response = self._disk_cache.get(key)
+            if response is not None:
+                self._cache_response(key, response)
+        return response
+
+    def _store_response(self, key: str, response: str) -> None:
+        """Store a response in memory and in the disk cache if configured"""
+        self._cache_response(key, response)
+        if response and self._disk_cache is not None:
+            self._disk_cache.set(key, response)
+
+    @classmethod
+    def _get_cached_response(cls, key: str) -> Optional[str]:
+        """Get a cached response and mark it as recently used"""
+        with cls._response_cache_lock:
+            response = cls._response_cache.get(key)
+            if response is not None:
+                cls._response_cache.move_to_end(key)
+            return response
+
+    @classmethod
+    def _cache_response(cls, key: str, response: str) -> None:
+        """Cache a response, evicting the least recently used entries"""
+        if not response:
+            return
+        with cls._response_cache_lock:
+            cls._response_cache[key] = response
+            cls._response_cache.move_to_end(key)
+            while len(cls._response_cache) > cls.RESPONSE_CACHE_SIZE:
+                cls._response_cache.popitem(last=False)
+
     def init_chat_with_context(self, context: str):
         """Initialize chat with specific content to analyze
         
@@ -1,9 +1,16 @@
 import pytz
 from datetime import datetime, date, timedelta
 import re
+import os
+import json
+import time
+import threading
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from isodate import parse_duration
-from typing import Tuple, Optional, Dict
+from concurrent.futures import Future
+from typing import Any, Callable, Tuple, Optional, Dict
 
 def iso_duration_to_minutes(duration: str) -> int:
     """Convert ISO 8601 duration to minutes
@@ -58,9 +65,14 @@ def make_clickable(text, link):
     """
     return f'<a href="{link}" target="_blank">{text}</a>'
 
+_FILENAME_INVALID_CHARS = re.compile(r'[^\w\-_\. ]')
+_FILENAME_SPACES = re.compile(r'\s+')
+
+@lru_cache(maxsize=1024)
 def sanitize_filename(filename: str, max_length: int = 255) -> str:
     """
     Sanitize a string to be used as a filename.
+    Results are memoized since the same titles are sanitized repeatedly.
     
     Args:
     filename (str): The string to be sanitized.
@@ -70,12 +82,125 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     str: The sanitized filename.
     """
     # Replace spaces with underscores and remove non-alphanumeric characters
-    sanitized = re.sub(r'[^\w\-_\. ]', '', filename)
-    sanitized = re.sub(r'\s+', '_', sanitized)
+    sanitized = _FILENAME_INVALID_CHARS.sub('', filename)
+    sanitized = _FILENAME_SPACES.sub('_', sanitized)
     
     # Trim the filename if it's too long
     return sanitized[:max_length]
 
+@dataclass
+class CacheConfig:
+    """On-disk cache settings for API responses
+    
+    Attributes:
+        cache_dir: Directory where cached JSON files are stored
+        ttl_seconds: How long a cached file stays valid, based on its mtime
+    """
+    cache_dir: str
+    ttl_seconds: int = 24 * 60 * 60
+
+def load_json_cache(file_path: str, ttl_seconds: int) -> Optional[Any]:
+    """
+    Load a cached JSON file if it exists and is younger than the TTL.
+    
+    Args:
+    file_path (str): Path to the cached JSON file.
+    ttl_seconds (int): Maximum age of the file in seconds.
+    
+    Returns:
+    The decoded JSON content, or None if the file is missing, stale or unreadable.
+    """
+    try:
+        if time.time() - os.path.getmtime(file_path) >= ttl_seconds:
+            return None
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_json_atomic(file_path: str, data: Any) -> None:
+    """
+    Write JSON to a file atomically so readers never see a partial file.
+    
+    Args:
+    file_path (str): Destination path.
+    data: JSON-serializable content.
+    """
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, file_path)
+
+class Singleflight:
+    """Collapse concurrent calls for the same key into a single execution
+    
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for and share its result (or exception). Nothing is
+    cached once the call completes.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn for key, or wait for the identical call already in flight"""
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_leader:
+            return future.result()
+        
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how often an operation may start
+    
+    Allows bursts of up to `burst` calls, then refills at `rate` calls per
+    second. Callers block in acquire() until a token is available.
+    """
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """Initialize limiter
+        
+        Args:
+            rate: Sustained calls per second
+            burst: Maximum calls allowed back to back (defaults to rate)
+        """
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a call is allowed"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 def get_start_end_dates_for_year(year: int = None) -> Tuple[datetime, datetime]:
     """
     Get the start and end dates for a given year.
@@ -1,29 +1,70 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from datetime import datetime
 import pytz
 import re
-from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
-from .utils import iso_duration_to_minutes, sanitize_filename
+from .utils import iso_duration_to_minutes, sanitize_filename, CacheConfig, load_json_cache, save_json_atomic, Singleflight, RateLimiter
 from .youtube_api_client import YouTubeAPIClient
 import os
-import json
+import orjson
 from typing import Optional, Tuple, Union, Dict, List
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 logger = logging.getLogger(__name__)
 
+_transcript_flight = Singleflight()
+
+# Client-side cap on transcript downloads so parallel prefetching backs off
+# before YouTube starts rejecting requests
+TRANSCRIPT_REQUESTS_PER_SECOND = 5
+_transcript_rate_limiter = RateLimiter(rate=TRANSCRIPT_REQUESTS_PER_SECOND)
+
+# First character of the text or of a sentence following '. '
+_SENTENCE_START_PATTERN = re.compile(r'(?:^|(?<=\. ))(\w)')
+
+def _transform_transcript_for_readability(transcript: str, language: str) -> str:
+    """Transform transcript text for better readability"""
+    if not transcript or language != 'en':
+        return transcript
+
+    # isupper() is False for text without cased characters and stops at the
+    # first lowercase one, so no separate scan for letters is needed
+    if transcript.isupper():
+        return _SENTENCE_START_PATTERN.sub(lambda m: m.group(1).upper(), transcript.lower())
+
+    return transcript
+
 class Video:
+    __slots__ = (
+        'video_id', 'url', 'youtube_api_client', '_transcript_language', 'timezone',
+        'title', 'published_at', 'duration_minutes', 'channel_id', 'channel_name',
+        '_transcript', '_metadata_fetched', '_transcript_fetched', 'cache_config'
+    )
+
     # Retry configuration constants
     DEFAULT_MAX_RETRIES = 3
     RETRY_MULTIPLIER = 1  # Base delay multiplier in seconds
     RETRY_MIN_WAIT = 4    # Minimum wait time between retries in seconds
     RETRY_MAX_WAIT = 10   # Maximum wait time between retries in seconds
+
+    # YouTube Data API limit for comma-separated IDs in one videos.list call
+    MAX_IDS_PER_REQUEST = 50
+
+    # Concurrent transcript downloads when fetching for many videos
+    # (e.g. BaseChannelClient.analyze_videos)
+    DEFAULT_TRANSCRIPT_WORKERS = 8
+    # Concurrent videos.list requests in create_from_video_ids
+    MAX_METADATA_REQUEST_WORKERS = 8
     
     def __init__(self, 
                  video_id: str, 
                  youtube_api_key: str = None,  # Make API key optional
                  transcript_language: str = 'en', 
-                 timezone: str = 'America/Chicago'):
+                 timezone: str = 'America/Chicago',
+                 cache_config: Optional[CacheConfig] = None,
+                 youtube_api_client: Optional[YouTubeAPIClient] = None):
         """Initialize Video object
         
         Args:
@@ -31,10 +72,14 @@ class Video:
             youtube_api_key: Optional YouTube Data API key
             transcript_language: Language code for transcript
             timezone: Timezone string
+            cache_config: Optional on-disk cache for metadata and transcripts
+            youtube_api_client: Optional shared API client; reusing one client
+                across videos reuses its API service and HTTP connections
         """
         self.video_id: str = video_id
         self.url: str = f"https://www.youtube.com/watch?v={video_id}"
-        self.youtube_api_client = YouTubeAPIClient(api_key=youtube_api_key)  # Create client with optional key
+        # Reuse the caller's client when given, otherwise create one with the optional key
+        self.youtube_api_client = youtube_api_client or YouTubeAPIClient(api_key=youtube_api_key)
         self._transcript_language = str(transcript_language)
         self.timezone = pytz.timezone(timezone)
         self.title: Optional[str] = None
@@ -42,9 +87,10 @@ class Video:
         self.duration_minutes: Optional[float] = None
         self.channel_id: Optional[str] = None
         self.channel_name: Optional[str] = None
-        self.transcript: Optional[Tuple[str, str]] = None
+        self._transcript: Optional[Tuple[str, str]] = None
         self._metadata_fetched: bool = False
         self._transcript_fetched: bool = False
+        self.cache_config = cache_config
 
     @property
     def transcript_language(self) -> str:
@@ -58,37 +104,82 @@ class Video:
         """Set the transcript language code, ensuring it's a string."""
         self._transcript_language = str(value)
 
+    @property
+    def transcript(self) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """Get the (text, language) transcript tuple, fetching it on first access."""
+        if self._transcript is None:
+            self.get_transcript()
+        return self._transcript
+
+    @transcript.setter
+    def transcript(self, value: Optional[Tuple[Optional[str], Optional[str]]]):
+        """Set the transcript directly, e.g. when loading from a file."""
+        self._transcript = value
+
     # Core data fetching methods
     def get_video_metadata(self) -> None:
         """Fetch basic video information from YouTube API"""
+        try:
+            cache_path = self._cache_path(f"{self.video_id}.json")
+            video_data = self._load_from_cache(cache_path)
+
+            if video_data is None:
+                # An expired entry is revalidated with its ETag; if the video is
+                # unchanged YouTube answers 304 with no body
+                stale_data = self._load_from_cache(cache_path, ignore_ttl=True) or {}
+                video_request = self.youtube_api_client.create_videos_request(
+                    part="snippet,contentDetails",
+                    id=self.video_id
+                )
+                video_response = self.youtube_api_client.execute_conditional_request(
+                    video_request, stale_data.get('_response_etag')
+                )
+
+                if video_response is None:
+                    logger.debug("Cached metadata for video %s is still current", self.video_id)
+                    video_data = stale_data
+                else:
+                    if not video_response['items']:
+                        raise ValueError(f"No video found for ID: {self.video_id}")
+
+                    video_data = video_response['items'][0]
+                    video_data['_response_etag'] = video_response.get('etag')
+                self._save_to_cache(cache_path, video_data)
+
+            self._apply_metadata(video_data)
+
+        except Exception as e:
+            self._metadata_fetched = False
+            logger.error("Failed to fetch video metadata for %s: %s", self.video_id, e)
+            raise
+
+    def get_video_duration(self) -> float:
+        """Fetch only the video duration from YouTube API
+        
+        Lightweight alternative to get_video_metadata for callers that only
+        need to filter videos by length before fetching anything else. The
+        response is trimmed to the duration field.
+        
+        Returns:
+            float: Video duration in minutes
+        """
         try:
             video_request = self.youtube_api_client.create_videos_request(
-                part="snippet,contentDetails",
-                id=self.video_id
+                part="contentDetails",
+                id=self.video_id,
+                fields="items(id,contentDetails/duration)"
             )
             video_response = self.youtube_api_client.execute_api_request(video_request)
 
-            if not video_response['items']:
+            if not video_response.get('items'):
                 raise ValueError(f"No video found for ID: {self.video_id}")
 
-            video_data = video_response['items'][0]
-            snippet = video_data['snippet']
-            content_details = video_data['contentDetails']
-
-            self.published_at = datetime.strptime(
-                snippet['publishedAt'], "%Y-%m-%dT%H:%M:%SZ"
-            ).replace(tzinfo=pytz.UTC).astimezone(self.timezone)
-
-            self.title = snippet['title']
+            content_details = video_response['items'][0]['contentDetails']
             self.duration_minutes = iso_duration_to_minutes(content_details['duration'])
-            self.channel_id = snippet['channelId']
-            self.channel_name = snippet['channelTitle']
-            
-            self._metadata_fetched = True
+            return self.duration_minutes
 
         except Exception as e:
-            self._metadata_fetched = False
-            logger.error(f"Failed to fetch video metadata for {self.video_id}: {str(e)}")
+            logger.error("Failed to fetch video duration for %s: %s", self.video_id, e)
             raise
 
     @retry(
@@ -102,84 +193,177 @@ class Video:
     )
     def get_transcript(self) -> Tuple[Optional[str], Optional[str]]:
         """Fetch and process video transcript"""
-        if self.transcript is not None and self._transcript_fetched:
-            logger.debug(f"Returning cached transcript for video {self.video_id}")
-            return self.transcript
+        if self._transcript is not None and self._transcript_fetched:
+            logger.debug("Returning cached transcript for video %s", self.video_id)
+            return self._transcript
+
+        cache_path = self._cache_path(f"{self.video_id}_{self.transcript_language}.transcript.json")
+        cached = self._load_from_cache(cache_path)
+        if cached is not None:
+            logger.debug("Loaded transcript for video %s from disk cache", self.video_id)
+            self._transcript = tuple(cached)
+            self._transcript_fetched = True
+            return self._transcript
 
-        logger.info(f"Attempting to fetch transcript for video {self.video_id}")
+        # Imported here so metadata-only and cached use skips loading the
+        # transcript client and its HTTP stack
+        from youtube_transcript_api import TranscriptsDisabled, NoTranscriptFound
+
+        logger.info("Attempting to fetch transcript for video %s", self.video_id)
         try:
             # Override retry count with class constant
             self.get_transcript.retry.stop = stop_after_attempt(self.DEFAULT_MAX_RETRIES)
             
-            transcript_list = YouTubeTranscriptApi.list_transcripts(self.video_id)
-            # logger.info(f"Available transcripts: {transcript_list}")
-            
-            # find_transcript will:
-            # 1. First try to find manually created transcripts in the order specified:
-            #    - English (en)
-            #    - Simplified Chinese (zh-Hans)
-            #    - Chinese (zh)
-            # 2. If no manual transcripts found, will then try auto-generated transcripts
-            #    in the same language order
-            # 3. Raises NoTranscriptFound if neither manual nor auto-generated transcripts
-            #    are available in any of the specified languages
-            transcript = transcript_list.find_transcript(['en','zh-Hans','zh'])
-            
-            # Log transcript details
-            logger.info(f"""Found transcript:
-            - Language: {transcript.language} ({transcript.language_code})
-            - Is Generated: {transcript.is_generated}
-            - Video ID: {transcript.video_id}""")
-            
-            full_transcript = ' '.join([entry['text'] for entry in transcript.fetch()])
-            transformed_transcript = self._transform_transcript_for_readability(full_transcript, transcript.language_code)
-            
-            self.transcript = (transformed_transcript, transcript.language_code)
+            # Concurrent fetches of the same video (e.g. separate Video objects in
+            # parallel analyses) share one set of requests
+            self._transcript = _transcript_flight.do(self.video_id, self._fetch_transcript)
             self._transcript_fetched = True
-            logger.debug(f"Successfully fetched and cached transcript for video {self.video_id}")
-            return self.transcript
+            self._save_to_cache(cache_path, list(self._transcript))
+            logger.debug("Successfully fetched and cached transcript for video %s", self.video_id)
+            return self._transcript
 
         except (TranscriptsDisabled, NoTranscriptFound) as e:
-            logger.error(f"Transcript error for video {self.video_id}: {str(e)}")
-            self.transcript = (None, None)
+            logger.error("Transcript error for video %s: %s", self.video_id, e)
+            self._transcript = (None, None)
             self._transcript_fetched = False
             return None, None
         except Exception as e:
-            logger.exception(f"An unexpected error occurred while fetching transcript for {self.video_id}: {str(e)}")
-            self.transcript = (None, None)
+            logger.exception("An unexpected error occurred while fetching transcript for %s: %s", self.video_id, e)
+            self._transcript = (None, None)
             self._transcript_fetched = False
             return None, None
 
+    def _fetch_transcript(self) -> Tuple[str, str]:
+        """Download the transcript and return (text, language code)"""
+        from youtube_transcript_api import YouTubeTranscriptApi
+
+        _transcript_rate_limiter.acquire()
+        transcript_list = YouTubeTranscriptApi.list_transcripts(self.video_id)
+        # logger.info(f"Available transcripts: {transcript_list}")
+        
+        # find_transcript will:
+        # 1. First try to find manually created transcripts in the order specified:
+        #    - English (en)
+        #    - Simplified Chinese (zh-Hans)
+        #    - Chinese (zh)
+        # 2. If no manual transcripts found, will then try auto-generated transcripts
+        #    in the same language order
+        # 3. Raises NoTranscriptFound if neither manual nor auto-generated transcripts
+        #    are available in any of the specified languages
+        transcript = transcript_list.find_transcript(['en','zh-Hans','zh'])
+        
+        # Log transcript details
+        logger.info("""Found transcript:
+        - Language: %s (%s)
+        - Is Generated: %s
+        - Video ID: %s""",
+                    transcript.language, transcript.language_code,
+                    transcript.is_generated, transcript.video_id)
+        
+        full_transcript = ' '.join(map(itemgetter('text'), transcript.fetch()))
+        transformed_transcript = _transform_transcript_for_readability(full_transcript, transcript.language_code)
+        return transformed_transcript, transcript.language_code
+
     def get_video_metadata_and_transcript(self) -> None:
-        """Fetch both video metadata and transcript"""
+        """Fetch both video metadata and transcript
+        
+        The two requests are independent, so the transcript is downloaded in
+        a worker thread while metadata is fetched on this one.
+        """
         try:
-            self.get_video_metadata()
-            self.get_transcript()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                transcript_future = executor.submit(self.get_transcript)
+                self.get_video_metadata()
+                transcript_future.result()
         except Exception as e:
-            logger.error(f"Failed to fetch video info and transcript for {self.video_id}: {str(e)}")
+            logger.error("Failed to fetch video info and transcript for %s: %s", self.video_id, e)
             raise
 
+    # Async fetching methods
+    async def aget_video_metadata(self) -> None:
+        """Fetch video metadata without blocking the event loop"""
+        await asyncio.to_thread(self.get_video_metadata)
+
+    async def aget_transcript(self) -> Tuple[Optional[str], Optional[str]]:
+        """Fetch video transcript without blocking the event loop"""
+        return await asyncio.to_thread(self.get_transcript)
+
+    async def aget_video_metadata_and_transcript(self) -> None:
+        """Fetch video metadata and transcript concurrently without blocking the event loop"""
+        await asyncio.gather(self.aget_video_metadata(), self.aget_transcript())
+
+    @staticmethod
+    async def bulk_aprocess(videos: List['Video']) -> List['Video']:
+        """Fetch metadata and transcripts for many videos concurrently
+        
+        Each video is fetched in its own worker thread so the network round
+        trips overlap. Failures are logged and do not cancel the other fetches.
+        
+        Args:
+            videos: Video objects to populate
+            
+        Returns:
+            List[Video]: Videos whose metadata was fetched successfully
+        """
+        results = await asyncio.gather(
+            *(video.aget_video_metadata_and_transcript() for video in videos),
+            return_exceptions=True
+        )
+        fetched = []
+        for video, result in zip(videos, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to fetch video %s: %s", video.video_id, result)
+            else:
+                fetched.append(video)
+        return fetched
+
     # Helper methods
-    def _transform_transcript_for_readability(self, transcript: str, language: str) -> str:
-        """Transform transcript text for better readability"""
-        if not transcript or language != 'en':
-            return transcript
+    def _apply_metadata(self, video_data: Dict) -> None:
+        """Populate metadata fields from a videos.list response item"""
+        snippet = video_data['snippet']
+        content_details = video_data['contentDetails']
 
-        def is_all_caps(text):
-            return text.isupper() and any(c.isalpha() for c in text)
+        self.published_at = datetime.fromisoformat(
+            snippet['publishedAt'].replace('Z', '+00:00')
+        ).astimezone(self.timezone)
 
-        if is_all_caps(transcript):
-            sentences = transcript.capitalize().split('. ')
-            transformed_transcript = '. '.join(sentence.capitalize() for sentence in sentences)
-            return transformed_transcript
+        self.title = snippet['title']
+        self.duration_minutes = iso_duration_to_minutes(content_details['duration'])
+        self.channel_id = snippet['channelId']
+        self.channel_name = snippet['channelTitle']
+        
+        self._metadata_fetched = True
 
-        return transcript
+    def _cache_path(self, file_name: str) -> Optional[str]:
+        """Get the cache file path, or None if caching is disabled"""
+        if self.cache_config is None:
+            return None
+        return os.path.join(self.cache_config.cache_dir, file_name)
+
+    def _load_from_cache(self, cache_path: Optional[str], ignore_ttl: bool = False):
+        """Load a cached API result if caching is enabled and the entry is fresh
+        
+        With ignore_ttl, expired entries are returned too (for revalidation).
+        """
+        if cache_path is None:
+            return None
+        ttl_seconds = float('inf') if ignore_ttl else self.cache_config.ttl_seconds
+        return load_json_cache(cache_path, ttl_seconds)
+
+    def _save_to_cache(self, cache_path: Optional[str], data) -> None:
+        """Save an API result to the cache; failures are logged, never raised"""
+        if cache_path is None:
+            return
+        try:
+            save_json_atomic(cache_path, data)
+        except OSError as e:
+            logger.warning("Failed to write cache file %s: %s", cache_path, e)
 
     # Serialization methods
     def to_dict(self) -> dict:
         """Convert video object to dictionary"""
         if not self._metadata_fetched:
-            self.get_video_metadata_and_transcript()
+            self.get_video_metadata()
         
         return {
             'Video ID': self.video_id,
@@ -223,7 +407,7 @@ class Video:
             self.get_video_metadata_and_transcript()
 
         if not self.title:
-            logger.warning(f"No video info available to save for video ID: {self.video_id}")
+            logger.warning("No video info available to save for video ID: %s", self.video_id)
             return None
 
         if file_name is None:
@@ -234,16 +418,16 @@ class Video:
         file_path = os.path.join(root_dir, file_name)
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
         
         return file_path
 
     @classmethod
     def create_from_json_file(cls, file_path: str) -> 'Video':
         """Create a Video object from a JSON file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
         
         video = cls(video_id=data['Video ID'])
         video.title = data['Title']
@@ -259,6 +443,75 @@ class Video:
         video._transcript_fetched = bool(video.transcript and video.transcript[0])
         return video
 
+    @classmethod
+    def create_from_video_ids(cls,
+                              video_ids: List[str],
+                              youtube_api_client: Optional[YouTubeAPIClient] = None,
+                              **video_kwargs) -> List['Video']:
+        """Create Video objects with metadata using batched API requests
+        
+        The videos.list endpoint accepts up to 50 comma-separated IDs, so N
+        videos cost ceil(N/50) requests instead of N, and those requests are
+        issued concurrently. Videos already in the disk cache (if a
+        cache_config is given) are not requested again.
+        
+        Args:
+            video_ids: YouTube video IDs
+            youtube_api_client: Optional shared API client used for all videos
+            **video_kwargs: Extra Video constructor arguments (e.g. timezone, cache_config)
+        
+        Returns:
+            List[Video]: Videos with metadata, in input order. IDs that were not
+                found (private or removed videos) are skipped.
+        """
+        youtube_api_client = youtube_api_client or YouTubeAPIClient(
+            api_key=video_kwargs.pop('youtube_api_key', None)
+        )
+        videos = {
+            video_id: cls(video_id, youtube_api_client=youtube_api_client, **video_kwargs)
+            for video_id in dict.fromkeys(video_ids)
+        }
+
+        # Serve what we can from the disk cache first
+        pending = []
+        for video_id, video in videos.items():
+            cache_path = video._cache_path(f"{video_id}.json")
+            video_data = video._load_from_cache(cache_path)
+            if video_data is not None:
+                video._apply_metadata(video_data)
+            else:
+                pending.append(video_id)
+
+        def fetch_chunk(chunk: List[str]) -> Dict:
+            request = youtube_api_client.create_videos_request(
+                part="snippet,contentDetails",
+                id=','.join(chunk)
+            )
+            return youtube_api_client.execute_api_request(request)
+
+        # Chunks are independent, so their requests run concurrently
+        chunks = [pending[start:start + cls.MAX_IDS_PER_REQUEST]
+                  for start in range(0, len(pending), cls.MAX_IDS_PER_REQUEST)]
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), cls.MAX_METADATA_REQUEST_WORKERS)) as executor:
+                responses = list(executor.map(fetch_chunk, chunks))
+        else:
+            responses = [fetch_chunk(chunk) for chunk in chunks]
+
+        for response in responses:
+            for video_data in response.get('items', []):
+                video = videos.get(video_data['id'])
+                if video is None:
+                    continue
+                video._apply_metadata(video_data)
+                video._save_to_cache(video._cache_path(f"{video.video_id}.json"), video_data)
+
+        missing = [video_id for video_id, video in videos.items() if not video._metadata_fetched]
+        if missing:
+            logger.warning("No video found for IDs: %s", ', '.join(missing))
+
+        return [video for video in videos.values() if video._metadata_fetched]
+
     def set_published_at(self, value: Union[str, datetime]):
         """Set the published_at datetime from string or datetime object"""
         if isinstance(value, str):
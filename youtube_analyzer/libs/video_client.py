@@ -1,16 +1,29 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, Generator, Iterator, List, Optional, Tuple, Union
 import os
+import asyncio
+import html
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .llm_processor import LLMProcessor, LLMConfig, Role, Task
 from .video import Video
+from .utils import CacheConfig
 import logging
 from .youtube_api_client import YouTubeAPIClient
 from dataclasses import dataclass
-import re
 
 
 logger = logging.getLogger(__name__)
 
+# Static stylesheet prepended to every formatted analysis
+_ANALYSIS_CSS = "<style>.section-header{color:#0068C9!important;font-weight:bold;font-size:1.2em;margin-top:20px;margin-bottom:10px;padding:5px 0}.video-info{margin-bottom:20px}.analysis-content{margin-top:20px}.video-link{margin:10px 0}</style>"
+
+# Video header and analysis body; title and url are HTML-escaped before
+# substitution since titles are user-controlled
+_ANALYSIS_TEMPLATE = '<div class="video-info"><h2>{title}</h2><div class="video-link"><a href="{url}" target="_blank">Watch on YouTube</a></div></div><div class="analysis-content">{analysis}</div>'
+
 @dataclass
 class AnalysisResult:
     """Represents a single analysis result from an LLM processor
@@ -76,42 +89,147 @@ class YouTubeVideoClient:
         ... )
         >>> client.add_processor("my_claude", custom_config)
     """
+    # Maximum number of processors queried concurrently in analyze_video
+    DEFAULT_MAX_WORKERS = 5
+    
+    # Recently fetched videos shared by all clients, so re-opening a video
+    # (e.g. on a Streamlit rerun or from another channel) skips the API
+    # call and reuses an already fetched transcript. Entries expire so
+    # titles and descriptions don't go stale. Keyed by video ID, timezone
+    # and cache directory, so a video is only shared between clients that
+    # would have built the same Video.
+    VIDEO_CACHE_SIZE = 128
+    VIDEO_CACHE_TTL = 10 * 60
+    _video_cache: 'OrderedDict[Tuple[str, str, Optional[str]], Tuple[Video, float]]' = OrderedDict()
+    _video_cache_lock = threading.Lock()
+    
+    # How long a repeated analysis (same processor, task prompt and role)
+    # is answered from this client's previous result
+    ANALYSIS_CACHE_TTL = 60 * 60
     
     def __init__(self, 
                  video_id: str,
-                 youtube_api_key: str = None):
+                 youtube_api_key: str = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 cache_config: Optional[CacheConfig] = None,
+                 video: Optional[Video] = None,
+                 youtube_api_client: Optional[YouTubeAPIClient] = None,
+                 fetch_transcript: bool = False):
         """Initialize YouTube video client
         
         Args:
             video_id: YouTube video ID to analyze
             youtube_api_key: Optional YouTube Data API key
+            max_workers: Maximum number of processors queried concurrently
+            cache_config: Optional on-disk cache for video metadata, transcripts
+                and LLM responses
+            video: Optional Video whose metadata was already fetched (e.g. via
+                Video.create_from_video_ids); skips the per-video metadata request
+            youtube_api_client: Optional shared API client (e.g. the channel's),
+                avoids building a new API service per video
+            fetch_transcript: Download the transcript up front, concurrently with
+                the metadata, instead of on first analysis or chat
         """
-        self.youtube_api_client = YouTubeAPIClient(api_key=youtube_api_key)
+        self.youtube_api_client = youtube_api_client or YouTubeAPIClient(api_key=youtube_api_key)
+        self.max_workers = max_workers
+        self.cache_config = cache_config
         self._processors: Dict[str, LLMProcessor] = {}
         self.analysis_results: List[AnalysisResult] = []
+        self._analysis_cache: Dict[Tuple[str, str, str], Tuple[AnalysisResult, float]] = {}
         self._video: Optional[Video] = None
         
-        self._initialize_video(video_id, youtube_api_key)
+        if video is not None:
+            if video.video_id != video_id:
+                raise ValueError(f"Video ID mismatch: {video.video_id} != {video_id}")
+            self._video = video
+            self._cache_video(video)
+        else:
+            self._video = self._get_cached_video(video_id, cache_config=cache_config)
+            if self._video is None:
+                self._initialize_video(video_id, youtube_api_key, cache_config, fetch_transcript)
+                self._cache_video(self._video)
+            elif fetch_transcript:
+                # The cached video may have only its metadata; the property
+                # fetches the transcript if it hasn't been yet
+                self._video.transcript
 
-    def _initialize_video(self, video_id: str, youtube_api_key: str = None) -> None:
-        """Initialize video object and fetch its data
+    def _initialize_video(self,
+                          video_id: str,
+                          youtube_api_key: str = None,
+                          cache_config: Optional[CacheConfig] = None,
+                          fetch_transcript: bool = False) -> None:
+        """Initialize video object and fetch its metadata
+        
+        Unless fetch_transcript is set, the transcript is fetched lazily the
+        first time it is needed for analysis or chat.
         
         Args:
             video_id: YouTube video ID
             youtube_api_key: Optional YouTube Data API key
+            cache_config: Optional on-disk cache for video metadata and transcripts
+            fetch_transcript: Fetch the transcript together with the metadata
         """
         try:
-            self._video = Video(video_id=video_id, youtube_api_key=youtube_api_key)
-            self._video.get_video_metadata_and_transcript()
+            self._video = Video(
+                video_id=video_id,
+                youtube_api_key=youtube_api_key,
+                cache_config=cache_config,
+                youtube_api_client=self.youtube_api_client
+            )
+            if fetch_transcript:
+                self._video.get_video_metadata_and_transcript()
+            else:
+                self._video.get_video_metadata()
             logger.info(f"Initialized video: {video_id}")
         except Exception as e:
             logger.error(f"Failed to initialize video: {e}")
             raise
 
+    @staticmethod
+    def _video_cache_key(video_id: str,
+                         timezone: str,
+                         cache_config: Optional[CacheConfig]) -> Tuple[str, str, Optional[str]]:
+        """Build the shared video cache key"""
+        return (video_id, timezone, cache_config.cache_dir if cache_config else None)
+
+    @classmethod
+    def _get_cached_video(cls,
+                          video_id: str,
+                          timezone: str = 'America/Chicago',
+                          cache_config: Optional[CacheConfig] = None) -> Optional[Video]:
+        """Return a recently fetched video, or None if missing or expired
+        
+        Args:
+            video_id: YouTube video ID
+            timezone: Timezone the video's dates must be reported in
+            cache_config: On-disk cache the video must be backed by
+        """
+        key = cls._video_cache_key(video_id, timezone, cache_config)
+        with cls._video_cache_lock:
+            entry = cls._video_cache.get(key)
+            if entry is None:
+                return None
+            video, fetched_at = entry
+            if time.monotonic() - fetched_at > cls.VIDEO_CACHE_TTL:
+                del cls._video_cache[key]
+                return None
+            cls._video_cache.move_to_end(key)
+            return video
+
+    @classmethod
+    def _cache_video(cls, video: Video) -> None:
+        """Cache a fetched video, evicting the least recently used entries"""
+        key = cls._video_cache_key(video.video_id, video.timezone.zone, video.cache_config)
+        with cls._video_cache_lock:
+            cls._video_cache[key] = (video, time.monotonic())
+            cls._video_cache.move_to_end(key)
+            while len(cls._video_cache) > cls.VIDEO_CACHE_SIZE:
+                cls._video_cache.popitem(last=False)
+
     def add_processor(self, name: str, config: LLMConfig) -> None:
         """Add a custom processor with given configuration"""
         try:
-            self._processors[name] = LLMProcessor(config)
+            self._processors[name] = LLMProcessor(config, cache_config=self.cache_config)
             logger.info(f"Processor '{name}' initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize processor '{name}': {e}")
@@ -155,51 +273,48 @@ class YouTubeVideoClient:
                     status_container.error("❌ No transcript available for this video")
                 return []
 
+            transcript_text = self._video.transcript[0]
+            # All results of one run share a timestamp
+            analyzed_at = datetime.now()
             analyses = []
-            # Process with each requested LLM
-            for proc_name in processor_names:
-                if proc_name not in self._processors:
-                    logger.error(f"Processor '{proc_name}' not found")
-                    continue
+            # Query all requested LLMs concurrently; each call is network-bound
+            max_workers = max(1, min(self.max_workers, len(processor_names)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for proc_name in processor_names:
+                    if proc_name not in self._processors:
+                        logger.error(f"Processor '{proc_name}' not found")
+                        continue
 
-                try:
                     # Update UI with current processor
                     if status_container:
                         status_container.info(f"🤖 Analyzing with {proc_name}...")
                     logger.info(f"Starting analysis with {proc_name}")
 
-                    # Get processor and analyze transcript
-                    processor = self._processors[proc_name]
-                    analysis = processor.process_text(
-                        text=self._video.transcript[0],
-                        task=task,
-                        role=role
+                    futures[proc_name] = executor.submit(
+                        self._run_processor, proc_name, transcript_text, task, role, analyzed_at
                     )
 
-                    if analysis:
-                        # Structure the analysis result
-                        result = AnalysisResult(
-                            content=analysis,
-                            model=f"{processor.config.provider}/{processor.config.model_name}",
-                            timestamp=datetime.now(),
-                            role=role.name if role else None,
-                            task=task.name,
-                            html=self._format_analysis_result(self._video, analysis, processor.config)
-                        )
-                        analyses.append(result)
-                        self.analysis_results.append(result)
-                        
-                        # Update UI with success
-                        if status_container:
-                            status_container.success(f"✅ Analysis complete for {proc_name}")
-                        logger.info(f"Analysis complete for {proc_name}")
+                # Collect results in the requested order; UI updates stay on this thread
+                for proc_name, future in futures.items():
+                    try:
+                        result = future.result()
 
-                except Exception as e:
-                    # Handle processor-specific errors
-                    if status_container:
-                        status_container.error(f"❌ Error with {proc_name}: {str(e)}")
-                    logger.error(f"Error with {proc_name}: {e}")
-                    continue
+                        if result:
+                            analyses.append(result)
+                            self._record_result(result)
+                            
+                            # Update UI with success
+                            if status_container:
+                                status_container.success(f"✅ Analysis complete for {proc_name}")
+                            logger.info(f"Analysis complete for {proc_name}")
+
+                    except Exception as e:
+                        # Handle processor-specific errors
+                        if status_container:
+                            status_container.error(f"❌ Error with {proc_name}: {str(e)}")
+                        logger.error(f"Error with {proc_name}: {e}")
+                        continue
 
             return analyses
 
@@ -210,6 +325,218 @@ class YouTubeVideoClient:
                 status_container.error(f"❌ Error analyzing video: {e}")
             return []
 
+    def _run_processor(self,
+                       proc_name: str,
+                       text: str,
+                       task: Task,
+                       role: Optional[Role] = None,
+                       analyzed_at: Optional[datetime] = None) -> Optional[AnalysisResult]:
+        """Analyze text with a single processor and structure the result
+        
+        Runs in a worker thread from analyze_video.
+        
+        Returns:
+            AnalysisResult, or None if the processor returned no analysis
+        """
+        cached = self._get_cached_analysis(proc_name, task, role)
+        if cached is not None:
+            return cached
+
+        processor = self._processors[proc_name]
+        analysis = processor.process_text(
+            text=text,
+            task=task,
+            role=role
+        )
+        result = self._build_result(processor, analysis, task, role, analyzed_at)
+        self._cache_analysis(proc_name, task, role, result)
+        return result
+
+    async def aanalyze_video(self,
+                             processor_names: List[str],
+                             task: Task,
+                             role: Optional[Role] = None) -> List[AnalysisResult]:
+        """Analyze video on an event loop, querying all processors concurrently
+        
+        Async counterpart of analyze_video for callers that already run an
+        event loop; uses each processor's native async client instead of a
+        thread per request.
+        
+        Args:
+            processor_names: List of processor names to use
+            task: Task configuration defining what analysis to perform
+            role: Optional role configuration defining the analyzer's perspective
+            
+        Returns:
+            List[AnalysisResult]: Results in processor_names order; failed
+                processors are skipped
+            
+        Raises:
+            ValueError: If processor doesn't exist. Use add_processor() to add new processors.
+        """
+        missing_processors = [name for name in processor_names if name not in self._processors]
+        if missing_processors:
+            raise ValueError(
+                f"Processors not found: {', '.join(missing_processors)}. "
+                "Use add_processor() to add new processors before analysis."
+            )
+
+        # The transcript is fetched lazily and the fetch blocks
+        transcript = await asyncio.to_thread(lambda: self._video.transcript)
+        if not transcript or not transcript[0]:
+            logger.error("No transcript available")
+            return []
+
+        analyzed_at = datetime.now()
+
+        async def run(proc_name: str) -> Optional[AnalysisResult]:
+            cached = self._get_cached_analysis(proc_name, task, role)
+            if cached is not None:
+                return cached
+            processor = self._processors[proc_name]
+            analysis = await processor.aprocess_text(text=transcript[0], task=task, role=role)
+            result = self._build_result(processor, analysis, task, role, analyzed_at)
+            self._cache_analysis(proc_name, task, role, result)
+            return result
+
+        results = await asyncio.gather(
+            *(run(name) for name in processor_names), return_exceptions=True
+        )
+
+        analyses = []
+        for proc_name, result in zip(processor_names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error with {proc_name}: {result}")
+            elif result:
+                analyses.append(result)
+                self._record_result(result)
+                logger.info(f"Analysis complete for {proc_name}")
+        return analyses
+
+    def stream_analysis(self,
+                        processor_name: str,
+                        task: Task,
+                        role: Optional[Role] = None) -> Generator[str, None, Optional[AnalysisResult]]:
+        """Analyze video with one processor, yielding HTML as the response streams in
+        
+        Each yielded value is the full analysis so far, formatted like
+        AnalysisResult.html, so a UI can replace its content in place and show
+        the first lines long before the model finishes. The complete result
+        is recorded like analyze_video's; a cached result was recorded when
+        it was first produced and is not added again.
+        
+        Args:
+            processor_name: Name of the processor to use
+            task: Task configuration defining what analysis to perform
+            role: Optional role configuration defining the analyzer's perspective
+            
+        Yields:
+            str: HTML of the analysis received so far
+            
+        Returns:
+            Optional[AnalysisResult]: The complete result (the generator's
+                StopIteration value), or None if there was no analysis
+            
+        Raises:
+            ValueError: If processor doesn't exist. Use add_processor() to add new processors.
+            Exception: If the stream fails; the partial analysis is not
+                cached or recorded
+        """
+        if processor_name not in self._processors:
+            raise ValueError(
+                f"Processors not found: {processor_name}. "
+                "Use add_processor() to add new processors before analysis."
+            )
+
+        cached = self._get_cached_analysis(processor_name, task, role)
+        if cached is not None:
+            yield cached.html
+            return cached
+
+        if not self._video.transcript or not self._video.transcript[0]:
+            logger.error("No transcript available")
+            return None
+
+        processor = self._processors[processor_name]
+        analyzed_at = datetime.now()
+        parts = []
+        rendered_chars = 0
+        for piece in processor.stream_text(text=self._video.transcript[0], task=task, role=role):
+            parts.append(piece)
+            # Re-render on line breaks; formatting is line-based, so partial
+            # lines would flicker between paragraph and bullet
+            if '\n' in piece:
+                analysis = ''.join(parts)
+                rendered_chars = len(analysis)
+                yield self._format_analysis_result(self._video, analysis, processor.config)
+
+        # Only reached when the stream completed; stream_text raises otherwise
+        analysis = ''.join(parts)
+        result = self._build_result(processor, analysis, task, role, analyzed_at)
+        if result is None:
+            return None
+        self._cache_analysis(processor_name, task, role, result)
+        self._record_result(result)
+        if rendered_chars != len(analysis):
+            yield result.html
+        return result
+
+    @staticmethod
+    def _analysis_key(proc_name: str, task: Task, role: Optional[Role]) -> Tuple[str, str, str]:
+        """Key analyses by prompt content, since custom tasks and roles share names"""
+        return (proc_name, task.prompt_template, (role.system_prompt or '') if role else '')
+
+    def _get_cached_analysis(self,
+                             proc_name: str,
+                             task: Task,
+                             role: Optional[Role] = None) -> Optional[AnalysisResult]:
+        """Return this client's earlier result for the same analysis, if still fresh"""
+        key = self._analysis_key(proc_name, task, role)
+        entry = self._analysis_cache.get(key)
+        if entry is None:
+            return None
+        result, analyzed_at = entry
+        if time.monotonic() - analyzed_at > self.ANALYSIS_CACHE_TTL:
+            self._analysis_cache.pop(key, None)
+            return None
+        logger.info(f"Using cached {task.name} analysis from {proc_name}")
+        return result
+
+    def _cache_analysis(self,
+                        proc_name: str,
+                        task: Task,
+                        role: Optional[Role],
+                        result: Optional[AnalysisResult]) -> None:
+        """Remember a successful analysis for _get_cached_analysis"""
+        if result is None:
+            return
+        key = self._analysis_key(proc_name, task, role)
+        self._analysis_cache[key] = (result, time.monotonic())
+
+    def _record_result(self, result: AnalysisResult) -> None:
+        """Add a result to analysis_results unless a cache hit already put it there"""
+        if not any(recorded is result for recorded in self.analysis_results):
+            self.analysis_results.append(result)
+
+    def _build_result(self,
+                      processor: LLMProcessor,
+                      analysis: Optional[str],
+                      task: Task,
+                      role: Optional[Role] = None,
+                      analyzed_at: Optional[datetime] = None) -> Optional[AnalysisResult]:
+        """Structure a processor's analysis, or None if it returned nothing"""
+        if not analysis:
+            return None
+
+        return AnalysisResult(
+            content=analysis,
+            model=f"{processor.config.provider}/{processor.config.model_name}",
+            timestamp=analyzed_at or datetime.now(),
+            role=role.name if role else None,
+            task=task.name,
+            html=self._format_analysis_result(self._video, analysis, processor.config)
+        )
+
     def chat(self, processor_name: str, question: str) -> Optional[str]:
         """Chat about video content using specified processor
         
@@ -244,9 +571,11 @@ class YouTubeVideoClient:
         """Format analysis with video context into HTML. Pure display, no coupling with chat."""
         formatted_analysis = self._format_text_to_html(analysis.strip())
         
-        html = f"""<style>.section-header{{color:#0068C9!important;font-weight:bold;font-size:1.2em;margin-top:20px;margin-bottom:10px;padding:5px 0}}.video-info{{margin-bottom:20px}}.analysis-content{{margin-top:20px}}.video-link{{margin:10px 0}}</style><div class="video-info"><h2>{video.title}</h2><div class="video-link"><a href="{video.url}" target="_blank">Watch on YouTube</a></div></div><div class="analysis-content">{formatted_analysis}</div>"""
-        
-        return html
+        return _ANALYSIS_CSS + _ANALYSIS_TEMPLATE.format_map({
+            'title': html.escape(video.title or ''),
+            'url': html.escape(video.url or ''),
+            'analysis': formatted_analysis
+        })
 
     def _format_text_to_html(self, text: str) -> str:
         """Convert text to HTML with basic formatting
@@ -293,19 +622,22 @@ class YouTubeVideoClient:
             if not line:  # Skip empty lines
                 continue
             
-            # Rule 1: Headers in brackets
-            if line.startswith('['):
+            # The first character decides the line type
+            first = line[0]
+            
+            # Rule 1: Headers in brackets (a '[' line without ']' is dropped)
+            if first == '[':
                 if in_list:
                     formatted_lines.append('</ul>')
                     in_list = False
-                header_match = re.match(r'\[(.*?)\]', line)
-                if header_match:
-                    formatted_lines.append(f'<div class="section-header">{header_match.group(1).strip()}</div>')
+                end = line.find(']')
+                if end != -1:
+                    formatted_lines.append(f'<div class="section-header">{line[1:end].strip()}</div>')
                 continue
             
             # Rule 2: Bullet points
-            if line.startswith(('•', '-')):
-                line = re.sub(r'^[•-]\s*', '', line)  # Remove bullet and spaces
+            if first == '•' or first == '-':
+                line = line[1:].lstrip()  # Bullet and spaces removed
                 if not in_list:
                     formatted_lines.append('<ul>')
                     in_list = True
@@ -347,6 +679,11 @@ class YouTubeVideoClient:
             for name, processor in self._processors.items()
         }
 
+    @property
+    def video(self) -> Video:
+        """Get the underlying Video object"""
+        return self._video
+
     @property
     def title(self) -> str:
         """Get video title"""
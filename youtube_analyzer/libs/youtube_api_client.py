@@ -1,12 +1,58 @@
 import os
 import logging
-from googleapiclient.discovery import build
+import threading
+import time
+from functools import lru_cache
 from googleapiclient.errors import HttpError
-from typing import Optional, List, Dict, Any
+from googleapiclient.http import HttpRequest, build_http
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime
+import pytz
 import re
+from .utils import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+_thread_local = threading.local()
+
+# Canonical channel IDs: "UC" followed by 22 URL-safe base64 characters
+_CHANNEL_ID_PATTERN = re.compile(r'UC[A-Za-z0-9_-]{22}')
+
+# Client-side cap on Data API requests across all threads, so parallel
+# fetches stay under the per-second limit instead of failing and retrying
+REQUESTS_PER_SECOND = 10
+REQUESTS_BURST = 20
+_request_rate_limiter = RateLimiter(rate=REQUESTS_PER_SECOND, burst=REQUESTS_BURST)
+
+def _build_request(http, *args, **kwargs) -> HttpRequest:
+    """Build API requests on a per-thread pooled HTTP connection
+    
+    httplib2.Http is not thread-safe, so the connection created by build()
+    cannot be shared across worker threads. Each thread instead lazily gets
+    its own Http object, which keeps its connection alive between requests
+    so repeated calls skip the TCP/TLS handshake.
+    """
+    thread_http = getattr(_thread_local, 'http', None)
+    if thread_http is None:
+        thread_http = _thread_local.http = build_http()
+    return HttpRequest(thread_http, *args, **kwargs)
+
+@lru_cache(maxsize=8)
+def _build_service(api_key: str):
+    """Build the YouTube Data API service once per API key
+    
+    build() parses the discovery document and generates every method stub,
+    which is slow and memory-heavy. The resulting service holds no per-call
+    state (requests go through _build_request's per-thread connections), so
+    all clients using the same key can share it.
+    """
+    # Imported here so importing this module (e.g. only to parse video IDs)
+    # doesn't load the discovery machinery
+    from googleapiclient.discovery import build
+
+    return build('youtube', 'v3', developerKey=api_key, requestBuilder=_build_request,
+                 cache_discovery=False, static_discovery=True)
+
 class YouTubeQuotaExceededError(Exception):
     """Raised when YouTube API quota is exceeded"""
     pass
@@ -26,11 +72,27 @@ class YouTubeRateLimitError(Exception):
 class YouTubeAPIClient:
     _working_key = None  # Class level variable
     
+    # Handle -> (channel ID, resolved at) shared by all clients; channel IDs
+    # never change, the TTL only bounds how long a renamed handle is stale
+    CHANNEL_ID_CACHE_TTL = 60 * 60
+    _channel_id_cache: Dict[str, Tuple[str, float]] = {}
+    _channel_id_cache_lock = threading.Lock()
+    
+    # Estimated quota usage per API key for the current quota day. Quota
+    # resets at midnight Pacific time; search.list costs 100 units, the
+    # list calls used here cost 1.
+    DAILY_QUOTA = 10_000
+    QUOTA_COSTS = {'youtube.search.list': 100}
+    DEFAULT_QUOTA_COST = 1
+    _quota_used: Dict[str, int] = {}
+    _quota_day = None
+    _quota_lock = threading.Lock()
+    
     def __init__(self, api_key: Optional[str] = None):
         """Initialize YouTube API client with multiple API keys"""
         # If we already have a working key, use it directly
         if YouTubeAPIClient._working_key:
-            self._youtube = build('youtube', 'v3', developerKey=YouTubeAPIClient._working_key)
+            self._youtube = _build_service(YouTubeAPIClient._working_key)
             self._current_key = YouTubeAPIClient._working_key
             return
             
@@ -80,7 +142,7 @@ class YouTubeAPIClient:
             # Only show first 4 and last 4 characters of the key
             masked_key = f"{key[:4]}...{key[-4:]}" if key else "None"
             logger.info(f"Testing API key: {masked_key}")
-            self._youtube = build('youtube', 'v3', developerKey=key)
+            self._youtube = _build_service(key)
             test_request = self._youtube.search().list(
                 part="id",  # Minimum required field
                 maxResults=1,  # Just need one result
@@ -88,6 +150,7 @@ class YouTubeAPIClient:
             )
             test_request.execute()
             self._current_key = key
+            self._record_quota_usage(test_request.methodId)
             YouTubeAPIClient._working_key = key
             return True
         
@@ -173,12 +236,66 @@ class YouTubeAPIClient:
             self._handle_api_error(e, f"listing videos for channel {channel_id}")
 
     def execute_api_request(self, request):
-        """Execute a YouTube API request with automatic key rotation on quota errors"""
+        """Execute a YouTube API request with automatic key rotation on quota errors
+        
+        Requests are rate limited across threads and counted against the
+        estimated daily quota of the current key.
+        """
+        _request_rate_limiter.acquire()
+        self._record_quota_usage(getattr(request, 'methodId', None))
         try:
             return request.execute()
         except HttpError as e:
             self._handle_api_error(e, "executing API request")
 
+    def execute_conditional_request(self, request, etag: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Execute a request with If-None-Match revalidation
+        
+        Args:
+            request: API request to execute
+            etag: ETag of the previously fetched response, if any
+            
+        Returns:
+            The response, or None if the resource is unchanged (HTTP 304)
+        """
+        if etag:
+            request.headers['If-None-Match'] = etag
+        _request_rate_limiter.acquire()
+        self._record_quota_usage(getattr(request, 'methodId', None))
+        try:
+            return request.execute()
+        except HttpError as e:
+            if etag and e.resp.status == 304:
+                return None
+            self._handle_api_error(e, "executing conditional API request")
+
+    @classmethod
+    def _reset_quota_if_new_day(cls) -> None:
+        """Clear usage counters when the Pacific-time quota day rolls over"""
+        today = datetime.now(pytz.timezone('America/Los_Angeles')).date()
+        if cls._quota_day != today:
+            cls._quota_day = today
+            cls._quota_used.clear()
+
+    def _record_quota_usage(self, method_id: Optional[str]) -> None:
+        """Add the estimated cost of a request to the current key's usage"""
+        cost = self.QUOTA_COSTS.get(method_id, self.DEFAULT_QUOTA_COST)
+        with self._quota_lock:
+            self._reset_quota_if_new_day()
+            used = self._quota_used.get(self._current_key, 0) + cost
+            self._quota_used[self._current_key] = used
+        if used > self.DAILY_QUOTA:
+            logger.warning(f"Estimated YouTube API quota usage ({used}) exceeds daily quota ({self.DAILY_QUOTA})")
+
+    def quota_remaining(self) -> int:
+        """Estimate the quota units left today for the current key
+        
+        Only requests made by this process are counted.
+        """
+        with self._quota_lock:
+            self._reset_quota_if_new_day()
+            return max(0, self.DAILY_QUOTA - self._quota_used.get(self._current_key, 0))
+
     def _rebuild_request(self, old_request):
         """Rebuild a request with the current API key"""
         # Get the same API endpoint
@@ -192,7 +309,8 @@ class YouTubeAPIClient:
         Retrieve the YouTube channel ID for a given username/handle.
         
         Args:
-            username: Channel username/handle (with or without @)
+            username: Channel username/handle (with or without @), or a
+                channel ID, which is returned as is
         
         Returns:
             str: YouTube channel ID
@@ -203,6 +321,17 @@ class YouTubeAPIClient:
         # Remove @ if present
         username = username.strip('@')
         
+        # Already a channel ID; no lookup needed
+        if _CHANNEL_ID_PATTERN.fullmatch(username):
+            return username
+        
+        # Handles are case-insensitive
+        cache_key = username.lower()
+        with self._channel_id_cache_lock:
+            cached = self._channel_id_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < self.CHANNEL_ID_CACHE_TTL:
+            return cached[0]
+        
         request = self._youtube.channels().list(
             part="id",
             forHandle=username
@@ -211,12 +340,21 @@ class YouTubeAPIClient:
         try:
             response = self.execute_api_request(request)
             if "items" in response and len(response["items"]) > 0:
-                return response["items"][0]["id"]
+                channel_id = response["items"][0]["id"]
+                with self._channel_id_cache_lock:
+                    self._channel_id_cache[cache_key] = (channel_id, time.monotonic())
+                return channel_id
             else:
                 raise ValueError(f"No channel found for @{username}")
         except Exception as e:
             raise ValueError(f"Error fetching channel ID: {str(e)}")
 
+    @classmethod
+    def invalidate_channel_id(cls, username: str) -> None:
+        """Drop a cached handle lookup, e.g. after a channel changed its handle"""
+        with cls._channel_id_cache_lock:
+            cls._channel_id_cache.pop(username.strip('@').lower(), None)
+
     def create_search_request(self, **kwargs):
         return self._youtube.search().list(**kwargs)
 
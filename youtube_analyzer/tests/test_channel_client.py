@@ -84,3 +84,42 @@ def _print_video_details(channel, video_ids):
         print(f"Published: {video.published_at}")
         print(f"URL: {video.url}")
         print("-" * 50)
+
+def test_aanalyze_videos_offline(monkeypatch):
+    """Test async bulk analysis with stubbed video clients (no API calls)"""
+    import asyncio
+    from types import SimpleNamespace
+    from ..libs import channel_client
+
+    monkeypatch.setattr(channel_client, "YouTubeAPIClient", lambda api_key=None: SimpleNamespace())
+    channel = channel_client.VirtualChannelClient(
+        name="test", video_ids=["a", "b", "bad", "c"], youtube_api_key="test-key"
+    )
+    active = []
+    peak = []
+
+    async def aanalyze_video(video_id, processor_names, task):
+        active.append(video_id)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.remove(video_id)
+        if video_id == "bad":
+            raise ValueError("No transcript")
+        return [f"{video_id}: {task.name}"]
+
+    def create_or_get_video_client(video_id):
+        return SimpleNamespace(
+            aanalyze_video=lambda **kwargs: aanalyze_video(video_id, **kwargs)
+        )
+
+    monkeypatch.setattr(channel, "preload_video_clients", lambda video_ids: None)
+    monkeypatch.setattr(channel, "create_or_get_video_client", create_or_get_video_client)
+
+    results = asyncio.run(channel.aanalyze_videos(
+        video_ids=["c", "a", "bad", "a"], processor_names=["stub"], max_parallel_videos=2
+    ))
+
+    assert list(results) == ["c", "a", "bad"]
+    assert results["c"] == ["c: summarize_transcript"]
+    assert results["bad"] == []
+    assert max(peak) <= 2
@@ -0,0 +1,19 @@
+import os
+from ..libs.llm_cache import LLMResponseCache
+from ..libs.utils import CacheConfig
+
+def test_llm_response_cache_round_trip(tmp_path):
+    """Test storing, reading and expiring cached LLM responses"""
+    cache = LLMResponseCache(CacheConfig(cache_dir=str(tmp_path), ttl_seconds=60))
+    key = "0123456789abcdef0123456789abcdef"
+
+    assert cache.get(key) is None  # Missing entry
+
+    cache.set(key, "[Summary]\n• Point")
+    assert cache.get(key) == "[Summary]\n• Point"
+
+    # Expired entries are ignored
+    path = os.path.join(cache.cache_dir, f"{key}.json")
+    old_time = os.path.getmtime(path) - 120
+    os.utime(path, (old_time, old_time))
+    assert cache.get(key) is None
@@ -227,4 +227,97 @@ def test_chat_memory(anthropic_config, test_text):
     assert response1 is not None
     assert response2 is not None
     print(f"Memory test responses:\n1: {response1}\n2: {response2}")
-    logger.info(f"Memory test responses:\n1: {response1}\n2: {response2}")
\ No newline at end of file
+    logger.info(f"Memory test responses:\n1: {response1}\n2: {response2}")
+
+
+### Long-text chunking tests (no API calls)
+
+@pytest.fixture
+def offline_processor(monkeypatch):
+    """Fixture providing a processor with small chunks; never sends requests"""
+    monkeypatch.setattr(LLMProcessor, "CHUNK_CHARS", 100)
+    monkeypatch.setattr(LLMProcessor, "CHUNK_OVERLAP_CHARS", 10)
+    return LLMProcessor(LLMConfig(provider="openai", model_name="gpt-4o", api_key="test-key"))
+
+def _chunk_spans(text: str, chunks):
+    """Locate each chunk in text, searching forward from the previous chunk"""
+    spans = []
+    search_from = 0
+    for chunk in chunks:
+        start = text.index(chunk, search_from)
+        spans.append((start, start + len(chunk)))
+        search_from = start + 1
+    return spans
+
+def test_split_text_short_text_is_one_chunk(offline_processor):
+    """Test that text within CHUNK_CHARS is not split"""
+    assert offline_processor._split_text("short text") == ["short text"]
+
+def test_split_text_covers_text_with_overlap(offline_processor):
+    """Test that chunks cover the text, overlap by CHUNK_OVERLAP_CHARS and break at spaces"""
+    text = ' '.join(f"word{i}" for i in range(200))
+    chunks = offline_processor._split_text(text)
+    spans = _chunk_spans(text, chunks)
+    
+    assert len(chunks) > 1
+    assert spans[0][0] == 0
+    assert spans[-1][1] == len(text)
+    assert all(len(chunk) <= LLMProcessor.CHUNK_CHARS for chunk in chunks)
+    for (prev_start, prev_end), (start, _) in zip(spans, spans[1:]):
+        assert start > prev_start
+        assert start == prev_end - LLMProcessor.CHUNK_OVERLAP_CHARS
+        # Every chunk but the last ends at a word boundary
+        assert text[prev_end] == ' '
+
+def test_split_text_always_moves_forward(offline_processor, monkeypatch):
+    """Test that splitting terminates even when the overlap is not smaller than a chunk"""
+    monkeypatch.setattr(LLMProcessor, "CHUNK_CHARS", 10)
+    monkeypatch.setattr(LLMProcessor, "CHUNK_OVERLAP_CHARS", 20)
+    text = "x" * 25
+    chunks = offline_processor._split_text(text)
+    spans = _chunk_spans(text, chunks)
+    
+    assert all(0 < len(chunk) <= 10 for chunk in chunks)
+    assert spans[-1][1] == len(text)
+    # Without room for the overlap, each chunk starts one character later
+    assert [start for start, _ in spans] == list(range(len(text) - 10 + 1))
+
+def test_reduce_task_keeps_literal_braces(offline_processor):
+    """Test that braces in a task prompt survive both formatting passes"""
+    task = Task(
+        name="json_summary",
+        description="Summarize as JSON",
+        prompt_template='Summarize as {{"summary": "..."}}.\n\nContent: {text}'
+    )
+    reduce_task = offline_processor._reduce_task(task)
+    prompt = reduce_task.prompt_template.format(text="Part 1:\nfirst answer")
+    
+    assert reduce_task.name == "json_summary_reduce"
+    assert 'Summarize as {"summary": "..."}.' in prompt
+    assert "Content: (provided as the answers below)" in prompt
+    assert prompt.endswith("Part 1:\nfirst answer")
+
+def test_process_texts_keeps_order_and_limit(offline_processor, monkeypatch):
+    """Test that batched texts come back in input order within max_concurrency"""
+    import threading
+    import time
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def process_text(self, text, task, role=None):
+        with lock:
+            active.append(text)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(text)
+        return None if text == "fail" else text.upper()
+
+    monkeypatch.setattr(LLMProcessor, "process_text", process_text)
+    task = Task(name="echo", description="Echo", prompt_template="{text}")
+    texts = ["a", "fail", "b", "c", "d"]
+
+    assert offline_processor.process_texts(texts, task, max_concurrency=2) == ["A", None, "B", "C", "D"]
+    assert max(peak) <= 2
+    assert offline_processor.process_texts([], task) == []
@@ -1,7 +1,10 @@
 import pytest
 from datetime import datetime, timedelta
 import pytz
-from ..libs.utils import iso_duration_to_minutes, get_formatted_date_today, make_clickable, DateFilter
+import os
+import threading
+import time
+from ..libs.utils import iso_duration_to_minutes, get_formatted_date_today, make_clickable, DateFilter, load_json_cache, save_json_atomic, Singleflight, RateLimiter
 
 def test_iso_duration_to_minutes():
     """Test conversion of ISO duration to minutes"""
@@ -125,4 +128,58 @@ def test_date_filter_timezone_handling():
     la_result = la_filter.from_dates(after=utc_date)
     
     assert chicago_result['publishedAfter'] == la_result['publishedAfter']
-    assert chicago_result['publishedAfter'] == utc_date.isoformat().replace('+00:00', 'Z')
\ No newline at end of file
+    assert chicago_result['publishedAfter'] == utc_date.isoformat().replace('+00:00', 'Z')
+
+def test_json_cache_round_trip(tmp_path):
+    """Test atomic JSON cache writes and TTL-based reads"""
+    cache_file = str(tmp_path / "cache" / "video.json")
+    data = {'id': 'eQZbi8HBRcQ', 'snippet': {'title': 'Starship'}}
+
+    assert load_json_cache(cache_file, ttl_seconds=60) is None  # Missing file
+
+    save_json_atomic(cache_file, data)
+    assert load_json_cache(cache_file, ttl_seconds=60) == data
+    assert os.listdir(tmp_path / "cache") == ["video.json"]  # No temp files left behind
+
+    # Expired entries are ignored
+    old_time = os.path.getmtime(cache_file) - 120
+    os.utime(cache_file, (old_time, old_time))
+    assert load_json_cache(cache_file, ttl_seconds=60) is None
+
+def test_singleflight_shares_concurrent_calls():
+    """Test that concurrent calls for one key run the function once"""
+    flight = Singleflight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)  # Keep the call in flight while the others arrive
+        return "transcript"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("eQZbi8HBRcQ", fetch)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["transcript"] * 5
+    assert len(calls) == 1
+
+    # Completed calls are not cached
+    flight.do("eQZbi8HBRcQ", fetch)
+    assert len(calls) == 2
+
+def test_rate_limiter_spaces_calls_after_burst():
+    """Test that calls beyond the burst wait for tokens to refill"""
+    limiter = RateLimiter(rate=20, burst=2)
+
+    start = time.monotonic()
+    for _ in range(2):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.05  # Burst passes immediately
+
+    for _ in range(2):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09  # Two more tokens at 20/s take ~0.1s
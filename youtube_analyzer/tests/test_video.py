@@ -70,4 +70,60 @@ def test_video_creation_without_assertions():
 
     video_dict = video.to_dict()
     print(f"\n ==={video.title}===")
-    print(f"{video_dict['Transcript']}")
\ No newline at end of file
+    print(f"{video_dict['Transcript']}")
+
+def _offline_api_client(items):
+    """Stub API client answering every videos.list request with items"""
+    from types import SimpleNamespace
+    requests = []
+
+    def create_videos_request(**kwargs):
+        requests.append(kwargs)
+        return kwargs
+
+    return SimpleNamespace(
+        requests=requests,
+        create_videos_request=create_videos_request,
+        execute_api_request=lambda request: {"items": items}
+    )
+
+def test_get_video_duration_offline():
+    """Test fetching only the duration with a stubbed API client"""
+    api_client = _offline_api_client([{"id": "abc", "contentDetails": {"duration": "PT1H30M"}}])
+    video = Video("abc", youtube_api_client=api_client)
+
+    assert video.get_video_duration() == 90
+    assert video.duration_minutes == 90
+    assert api_client.requests == [{
+        "part": "contentDetails",
+        "id": "abc",
+        "fields": "items(id,contentDetails/duration)"
+    }]
+
+    video = Video("missing", youtube_api_client=_offline_api_client([]))
+    with pytest.raises(ValueError):
+        video.get_video_duration()
+
+def test_bulk_aprocess_skips_failed_videos(monkeypatch):
+    """Test that one failed fetch doesn't drop the other videos"""
+    import asyncio
+
+    def get_video_metadata(self):
+        if self.video_id == "bad":
+            raise ValueError("No video found")
+        self.title = f"Title {self.video_id}"
+
+    def get_transcript(self):
+        self.transcript = (f"Transcript {self.video_id}", "en")
+        return self.transcript
+
+    monkeypatch.setattr(Video, "get_video_metadata", get_video_metadata)
+    monkeypatch.setattr(Video, "get_transcript", get_transcript)
+
+    api_client = _offline_api_client([])
+    videos = [Video(video_id, youtube_api_client=api_client) for video_id in ("a", "bad", "b")]
+    fetched = asyncio.run(Video.bulk_aprocess(videos))
+
+    assert [video.video_id for video in fetched] == ["a", "b"]
+    assert fetched[1].title == "Title b"
+    assert fetched[1].transcript == ("Transcript b", "en")
@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+from ..libs.youtube_api_client import YouTubeAPIClient
+
+def _offline_client(monkeypatch, channel_id):
+    """Build a client without API keys whose channel lookups are counted"""
+    monkeypatch.setattr(YouTubeAPIClient, "_channel_id_cache", {})
+    client = YouTubeAPIClient.__new__(YouTubeAPIClient)
+    client._youtube = SimpleNamespace(
+        channels=lambda: SimpleNamespace(list=lambda **kwargs: kwargs)
+    )
+    client.requests = []
+
+    def execute_api_request(request):
+        client.requests.append(request)
+        return {"items": [{"id": channel_id}]}
+
+    client.execute_api_request = execute_api_request
+    return client
+
+def test_channel_id_cache_and_invalidation(monkeypatch):
+    """Test that handle lookups are cached until invalidated"""
+    channel_id = "UC" + "a" * 22
+    client = _offline_client(monkeypatch, channel_id)
+
+    assert client.get_channel_id("@SomeChannel") == channel_id
+    assert client.get_channel_id("somechannel") == channel_id  # Case-insensitive
+    assert len(client.requests) == 1
+
+    YouTubeAPIClient.invalidate_channel_id("@SomeChannel")
+    assert client.get_channel_id("@SomeChannel") == channel_id
+    assert len(client.requests) == 2
+    assert client.requests[-1]["forHandle"] == "SomeChannel"
+
+    # Channel IDs are returned without a lookup
+    assert client.get_channel_id(channel_id) == channel_id
+    assert len(client.requests) == 2